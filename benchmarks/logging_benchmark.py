@@ -0,0 +1,125 @@
+"""
+Benchmark the per-request logging overhead on the prediction path.
+
+Every arm logs exactly the same records (the prediction event from
+``predict``) with the same JSON formatter, so each step isolates one effect:
+
+* ``sync``: records written inline by a ``FileHandler`` on the calling thread
+* ``queued``: records handed to the background listener, none sampled away
+* ``queued + sampled``: as ``queued``, keeping 1% of prediction records
+
+A ``no logging`` arm gives the cost of the prediction itself. Arms are run in
+alternating order over several trials and the medians are reported.
+
+Usage:
+    python benchmarks/logging_benchmark.py --requests 20000 --threads 16 --trials 5
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.synthetic import generate_dataset  # noqa: E402
+from src.model.model_trainer import predict  # noqa: E402
+from src.utils.logging_utils import JsonFormatter, configure_logging, stop_logging  # noqa: E402
+
+SAMPLING = {"src.model.predictions": 0.01}
+FEATURES = ["Pregnancies", "Glucose", "BloodPressure", "BMI", "Age"]
+
+
+def build_model():
+    """Fit a tiny model so that logging dominates the measured cost"""
+    df = generate_dataset(1000, seed=0)
+    return LogisticRegression(max_iter=1000).fit(df[FEATURES].to_numpy(), df["Outcome"])
+
+
+def reset_root(level=logging.INFO):
+    stop_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(level)
+    return root
+
+
+def configure_arm(arm, log_file):
+    """Set up the root logger for one arm"""
+    if arm == "no logging":
+        reset_root(logging.WARNING)
+    elif arm == "sync":
+        handler = logging.FileHandler(log_file)
+        handler.setFormatter(JsonFormatter())
+        reset_root().addHandler(handler)
+    elif arm == "queued":
+        configure_logging(log_file=log_file, console=False)
+    else:
+        configure_logging(log_file=log_file, console=False, sampling=SAMPLING)
+
+
+def run(model, requests, threads):
+    """Issue ``requests`` predictions from ``threads`` workers
+
+    Returns:
+        np.ndarray: Per-request latencies in microseconds
+    """
+    sample = np.array([[2, 130, 70, 28.5, 45]])
+    latencies = np.empty(requests)
+
+    def one(i):
+        start = time.perf_counter()
+        predict(model, sample)
+        latencies[i] = (time.perf_counter() - start) * 1e6
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one, range(requests)))
+    return latencies
+
+
+def report(name, trials):
+    means = [latencies.mean() for latencies in trials]
+    p99s = [np.percentile(latencies, 99) for latencies in trials]
+    print(f"{name:<18} mean {np.median(means):8.1f} us "
+          f"[{min(means):7.1f}-{max(means):7.1f}]   "
+          f"p99 {np.median(p99s):8.1f} us [{min(p99s):7.1f}-{max(p99s):7.1f}]")
+    return np.median(means)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--trials", type=int, default=5)
+    args = parser.parse_args()
+
+    arms = ["no logging", "sync", "queued", "queued + sampled"]
+    results = {arm: [] for arm in arms}
+    model = build_model()
+    with tempfile.TemporaryDirectory() as tmp:
+        run(model, 1000, args.threads)  # warm up
+        for trial in range(args.trials):
+            # Alternate the order so drift does not favour one arm
+            for arm in arms if trial % 2 == 0 else reversed(arms):
+                configure_arm(arm, Path(tmp) / f"{trial}-{arm.replace(' ', '')}.log")
+                results[arm].append(run(model, args.requests, args.threads))
+                reset_root()
+
+    print(f"{args.trials} trials x {args.requests} requests, {args.threads} threads "
+          f"(median [min-max] across trials)")
+    means = {arm: report(arm, results[arm]) for arm in arms}
+    base = means["no logging"]
+    for arm in arms[1:]:
+        print(f"logging overhead, {arm:<18} {means[arm] - base:7.1f} us per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark the effect of shadow scoring on primary prediction latency.
+
+Serves the same request stream through an ``InferenceExecutor`` with and
+without a ``ShadowScorer`` attached and compares the primary p50/p99 latency.
+Requests arrive open-loop at a fixed rate (by default half of the measured
+capacity), as live traffic does, from several concurrent clients. Baseline and
+shadow runs alternate over several trials, and the median and range across
+trials are reported. Models are trained on synthetic data, so no network
+access is needed.
+
+Usage:
+    python benchmarks/shadow_benchmark.py --requests 3000 --clients 8 --trials 5
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.data.synthetic import generate_dataset  # noqa: E402
+from src.model.inference import InferenceExecutor  # noqa: E402
+from src.model.model_factory import build_model  # noqa: E402
+from src.model.shadow import ShadowScorer  # noqa: E402
+
+FEATURES = ["Pregnancies", "Glucose", "BloodPressure", "BMI", "Age"]
+
+
+def train_models(tmp):
+    """Train a primary and a shadow model and save them under ``tmp``"""
+    df = generate_dataset(20_000, seed=0)
+    X, y = df[FEATURES].to_numpy(), df["Outcome"].to_numpy()
+    paths = {}
+    for role, name, params in [
+        ("primary", "RandomForest", {"n_estimators": 100, "max_depth": 10, "random_state": 0}),
+        ("shadow", "HistGradientBoosting", {"max_iter": 200, "random_state": 0}),
+    ]:
+        paths[role] = tmp / f"{role}.pkl"
+        joblib.dump(build_model(name, params).fit(X, y), paths[role])
+    return paths, X[:1000]
+
+
+def run(executor, rows, requests, clients, rate=None):
+    """
+    Send ``requests`` single-row predictions from ``clients`` threads
+
+    Args:
+        rate (float, optional): Requests per second; as fast as possible if None
+
+    Returns:
+        np.ndarray: Per-request latencies in milliseconds
+    """
+    latencies = np.empty(requests)
+    begin = time.perf_counter()
+
+    def one(i):
+        row = rows[i % len(rows)].reshape(1, -1)
+        if rate:
+            time.sleep(max(0.0, begin + i / rate - time.perf_counter()))
+        start = time.perf_counter()
+        executor.predict(row)
+        latencies[i] = (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(one, range(requests)))
+    return latencies
+
+
+def run_arm(paths, rows, args, rate, shadowed):
+    """Serve one trial on a fresh executor, with or without the shadow model
+
+    Returns:
+        tuple: (latencies in milliseconds, shadow stats or None)
+    """
+    options = dict(workers=args.workers, max_queue=args.clients * 2)
+    shadow = ShadowScorer(paths["shadow"]) if shadowed else None
+    with InferenceExecutor(paths["primary"], shadow=shadow, **options) as executor:
+        run(executor, rows, 200, args.clients)  # warm up
+        latencies = run(executor, rows, args.requests, args.clients, rate)
+    return latencies, shadow.stats() if shadow else None
+
+
+def report(name, trials):
+    p50s = [np.percentile(latencies, 50) for latencies in trials]
+    p99s = [np.percentile(latencies, 99) for latencies in trials]
+    print(f"{name:<14} p50 {np.median(p50s):7.2f} ms [{min(p50s):6.2f}-{max(p50s):6.2f}]   "
+          f"p99 {np.median(p99s):7.2f} ms [{min(p99s):6.2f}-{max(p99s):6.2f}]")
+    return np.array(p99s)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--load", type=float, default=0.5,
+                        help="Request rate as a fraction of measured capacity")
+    parser.add_argument("--trials", type=int, default=5,
+                        help="Alternating baseline/shadow runs per arm")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    results = {False: [], True: []}
+    shadow_stats = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, rows = train_models(Path(tmp))
+
+        # Large enough queue that the serving pool never rejects
+        with InferenceExecutor(paths["primary"], workers=args.workers,
+                               max_queue=args.clients * 2) as executor:
+            run(executor, rows, 200, args.clients)
+            start = time.perf_counter()
+            run(executor, rows, 500, args.clients)  # measure capacity
+            rate = args.load * 500 / (time.perf_counter() - start)
+
+        for trial in range(args.trials):
+            # Alternate which arm goes first so drift does not favour either
+            for shadowed in (False, True) if trial % 2 == 0 else (True, False):
+                latencies, stats = run_arm(paths, rows, args, rate, shadowed)
+                results[shadowed].append(latencies)
+                if stats:
+                    shadow_stats.append(stats)
+
+    print(f"{os.cpu_count()} cores, {args.workers} workers, {args.clients} clients, "
+          f"{rate:.0f} req/s, {args.trials} trials (median [min-max])")
+    baseline = report("primary only", results[False])
+    shadowed = report("with shadow", results[True])
+    changes = shadowed / baseline - 1
+    print(f"p99 change per trial: median {np.median(changes):+.1%} "
+          f"[{changes.min():+.1%} to {changes.max():+.1%}]")
+    print(f"shadow (last trial): {shadow_stats[-1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,33 @@
 # main.py - Entry point for training pipeline
+import argparse
+import mlflow
 from src.pipeline.training_pipeline import run_training_pipeline
+from src.utils.common import setup_logging
+from src.utils.instrumentation import run_profiled
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the diabetes training pipeline")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run under cProfile and log the profile as an MLflow artifact",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profiles",
+        help="Directory for profile output (default: profiles)",
+    )
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    run_training_pipeline()
+    args = parse_args()
+    setup_logging()
+
+    if args.profile:
+        _, paths = run_profiled(run_training_pipeline, args.profile_dir)
+        # Attach to the run the pipeline logged its model and metrics to
+        with mlflow.start_run(run_id=mlflow.last_active_run().info.run_id):
+            for path in paths:
+                mlflow.log_artifact(str(path), "profile")
+    else:
+        run_training_pipeline()
@@ -10,7 +10,7 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
 from .data import ingest_data, validate_data
-from .model import train_model, save_model, load_model, predict
+from .model import train_model, save_model, load_model, predict, InferenceExecutor
 from .pipeline import run_training_pipeline
 from .utils import load_config, setup_logging
 from .exceptions import (
@@ -19,6 +19,7 @@ from .exceptions import (
     DataValidationError,
     ModelTrainingError,
     ModelPredictionError,
+    InferenceOverloadError,
     ConfigurationError,
 )
 from .constants import (
@@ -38,6 +39,7 @@ __all__ = [
     "save_model",
     "load_model",
     "predict",
+    "InferenceExecutor",
     "run_training_pipeline",
     "load_config",
     "setup_logging",
@@ -46,6 +48,7 @@ __all__ = [
     "DataValidationError",
     "ModelTrainingError",
     "ModelPredictionError",
+    "InferenceOverloadError",
     "ConfigurationError",
     "PROJECT_ROOT",
     "DATA_DIR",
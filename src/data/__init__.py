@@ -3,6 +3,6 @@
 Data ingestion and validation module for diabetes prediction.
 """
 
-from .data_ingestion import ingest_data, validate_data
+from .data_ingestion import ingest_data, validate_data, load_dataset
 
-__all__ = ["ingest_data", "validate_data"]
\ No newline at end of file
+__all__ = ["ingest_data", "validate_data", "load_dataset"]
\ No newline at end of file
@@ -7,8 +7,9 @@ import pandas as pd
 import logging
 from pathlib import Path
 from ..utils.common import load_config
-from ..constants import RAW_DATA_FILE, REQUIRED_COLUMNS
+from ..constants import PROJECT_ROOT, RAW_DATA_FILE, REQUIRED_COLUMNS
 from ..exceptions import DataIngestionError, DataValidationError
+from ..utils.instrumentation import timed
 
 
 def download_dataset():
@@ -27,33 +28,66 @@ def download_dataset():
 
     try:
         if not RAW_DATA_FILE.exists():
-            logger.info(f"Downloading dataset from {url}")
+            logger.info("Downloading dataset from %s", url)
             df = pd.read_csv(url)
             RAW_DATA_FILE.parent.mkdir(exist_ok=True)
             df.to_csv(RAW_DATA_FILE, index=False)
-            logger.info(f"Dataset saved to {RAW_DATA_FILE}")
+            logger.info("Dataset saved to %s", RAW_DATA_FILE)
             return df
         else:
-            logger.info(f"Dataset already exists at {RAW_DATA_FILE}")
+            logger.info("Dataset already exists at %s", RAW_DATA_FILE)
             return pd.read_csv(RAW_DATA_FILE)
     except Exception as e:
-        logger.error(f"Failed to download or load dataset: {e}")
+        logger.error("Failed to download or load dataset: %s", e)
         raise DataIngestionError(f"Data ingestion failed: {e}")
 
-def ingest_data():
+def load_dataset(path):
+    """
+    Load a dataset from a CSV file, Parquet file or directory of Parquet files
+
+    Args:
+        path: Dataset location (relative to project root)
+
+    Returns:
+        pd.DataFrame: The loaded dataset
+
+    Raises:
+        DataIngestionError: If the dataset cannot be read
+    """
+    logger = logging.getLogger(__name__)
+    path = PROJECT_ROOT / path
+
+    try:
+        logger.info("Loading dataset from %s", path)
+        if path.is_dir() or path.suffix in (".parquet", ".pq"):
+            return pd.read_parquet(path)
+        return pd.read_csv(path)
+    except Exception as e:
+        logger.error("Failed to load dataset from %s: %s", path, e)
+        raise DataIngestionError(f"Data ingestion failed: {e}")
+
+@timed("ingest_data")
+def ingest_data(path=None):
     """
     Ingest data from local file or download if needed
 
+    Args:
+        path: Dataset to read instead of the downloaded one, e.g. the output of
+            ``src.data.synthetic``. Defaults to ``data.path`` in params.yaml.
+
     Returns:
         pd.DataFrame: The ingested dataset
     """
     logger = logging.getLogger(__name__)
 
-    df = download_dataset()
-    logger.info(f"Data ingested successfully. Shape: {df.shape}")
-    logger.info(f"Columns: {df.columns.tolist()}")
+    if path is None:
+        path = load_config()["data"].get("path")
+    df = load_dataset(path) if path else download_dataset()
+    logger.info("Data ingested successfully. Shape: %s", df.shape)
+    logger.info("Columns: %s", df.columns.tolist())
     return df
 
+@timed("validate_data")
 def validate_data(df):
     """
     Basic data validation
@@ -71,7 +105,7 @@ def validate_data(df):
 
     if not all(col in df.columns for col in REQUIRED_COLUMNS):
         missing_cols = [col for col in REQUIRED_COLUMNS if col not in df.columns]
-        logger.error(f"Missing required columns: {missing_cols}")
+        logger.error("Missing required columns: %s", missing_cols)
         raise DataValidationError(f"Missing required columns: {missing_cols}")
 
     if df.isnull().sum().sum() > 0:
@@ -79,7 +113,7 @@ def validate_data(df):
         # Fill missing values with median for numerical columns
         for col in df.select_dtypes(include=['number']).columns:
             if df[col].isnull().sum() > 0:
-                df[col].fillna(df[col].median(), inplace=True)
+                df[col] = df[col].fillna(df[col].median())
         logger.info("Missing values filled with median")
 
     logger.info("Data validation completed")
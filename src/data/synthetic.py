@@ -0,0 +1,236 @@
+"""
+Deterministic synthetic diabetes data for load and scale testing.
+
+Rows are drawn from a class-conditional Gaussian copula fitted by hand to the
+published statistics of the Pima Indians diabetes dataset, including its
+zero-valued "missing" measurements. Generation is fully vectorized and
+chunked, so arbitrarily large datasets can be written with bounded memory.
+
+Usage:
+    python -m src.data.synthetic --rows 10000000 --output data/synthetic.parquet
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..constants import REQUIRED_COLUMNS
+from ..exceptions import DataIngestionError
+
+
+# Fraction of positive outcomes in the source data
+OUTCOME_RATE = 0.349
+
+# Feature order used by the copula below
+FEATURES = ["Pregnancies", "Glucose", "BloodPressure", "BMI", "Age"]
+
+# Per-class marginal (mean, std) of the non-zero values, indexed by Outcome
+MARGINALS = {
+    "Pregnancies": ((3.3, 3.0), (4.9, 3.7)),
+    "Glucose": ((110.6, 24.8), (142.3, 29.6)),
+    "BloodPressure": ((70.9, 11.9), (75.3, 12.3)),
+    "BMI": ((30.9, 6.5), (35.4, 6.6)),
+    "Age": ((31.2, 11.7), (37.1, 11.0)),
+}
+
+# Correlation of the latent Gaussian copula, shared by both classes
+CORRELATION = np.array([
+    # Preg  Gluc  BP    BMI   Age
+    [1.00, 0.10, 0.14, 0.02, 0.54],
+    [0.10, 1.00, 0.15, 0.22, 0.26],
+    [0.14, 0.15, 1.00, 0.28, 0.24],
+    [0.02, 0.22, 0.28, 1.00, 0.03],
+    [0.54, 0.26, 0.24, 0.03, 1.00],
+])
+
+# Extra mass at zero pregnancies on top of the skewed count distribution
+PREGNANCY_ZERO_RATE = 0.10
+
+# Fraction of rows recorded as 0 where the measurement is missing
+ZERO_RATES = {"Glucose": 0.0065, "BloodPressure": 0.0456, "BMI": 0.0143}
+
+# Physiological bounds of the non-zero values
+BOUNDS = {
+    "Pregnancies": (0, 17),
+    "Glucose": (44, 199),
+    "BloodPressure": (24, 122),
+    "BMI": (18.2, 67.1),
+    "Age": (21, 81),
+}
+
+_CHOLESKY = np.linalg.cholesky(CORRELATION)
+
+
+def _lognormal_params(mean, std, shift=0.0):
+    """Return (mu, sigma) of a lognormal with the given mean and std above ``shift``"""
+    mean = mean - shift
+    sigma2 = np.log1p((std / mean) ** 2)
+    return np.log(mean) - sigma2 / 2, np.sqrt(sigma2)
+
+
+def generate_chunk(n_rows, rng, nan_rate=0.0):
+    """
+    Generate one chunk of synthetic rows
+
+    Args:
+        n_rows (int): Number of rows
+        rng (np.random.Generator): Random generator
+        nan_rate (float): Fraction of Glucose/BloodPressure/BMI values set to NaN
+
+    Returns:
+        pd.DataFrame: Rows with the columns in REQUIRED_COLUMNS
+    """
+    outcome = (rng.random(n_rows) < OUTCOME_RATE).astype(np.int8)
+    z = rng.standard_normal((n_rows, len(FEATURES))) @ _CHOLESKY.T
+
+    columns = {}
+    for j, name in enumerate(FEATURES):
+        (mean0, std0), (mean1, std1) = MARGINALS[name]
+        mean = np.where(outcome == 1, mean1, mean0)
+        std = np.where(outcome == 1, std1, std0)
+        low, high = BOUNDS[name]
+        if name == "Pregnancies":
+            # Zero-inflated, right-skewed count
+            mu, sigma = _lognormal_params(mean / (1 - PREGNANCY_ZERO_RATE) + 0.5, std)
+            values = np.round(np.exp(mu + sigma * z[:, j]) - 0.5)
+            values[rng.random(n_rows) < PREGNANCY_ZERO_RATE] = 0
+        elif name == "Age":
+            # Right-skewed above the minimum age
+            mu, sigma = _lognormal_params(mean, std, shift=low)
+            values = low + np.exp(mu + sigma * z[:, j])
+        else:
+            values = mean + std * z[:, j]
+        columns[name] = np.clip(values, low, high)
+
+    for name, rate in ZERO_RATES.items():
+        columns[name][rng.random(n_rows) < rate] = 0
+    if nan_rate:
+        for name in ZERO_RATES:
+            columns[name][rng.random(n_rows) < nan_rate] = np.nan
+
+    df = pd.DataFrame({
+        "Pregnancies": columns["Pregnancies"].astype(np.int16),
+        "Glucose": np.round(columns["Glucose"]),
+        "BloodPressure": np.round(columns["BloodPressure"]),
+        "BMI": np.round(columns["BMI"], 1),
+        "Age": np.round(columns["Age"]).astype(np.int16),
+        "Outcome": outcome,
+    })
+    return df[REQUIRED_COLUMNS]
+
+
+def generate_chunks(n_rows, seed=42, chunk_size=1_000_000, nan_rate=0.0):
+    """
+    Yield synthetic rows in chunks
+
+    Each chunk has its own child seed, so output is reproducible for a given
+    ``seed`` and ``chunk_size``.
+
+    Yields:
+        pd.DataFrame: Up to ``chunk_size`` rows
+    """
+    n_chunks = -(-n_rows // chunk_size)
+    for index, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        size = min(chunk_size, n_rows - index * chunk_size)
+        yield generate_chunk(size, np.random.default_rng(child), nan_rate=nan_rate)
+
+
+def generate_dataset(n_rows, seed=42, nan_rate=0.0):
+    """
+    Generate a synthetic dataset in memory
+
+    Returns:
+        pd.DataFrame: ``n_rows`` synthetic rows
+    """
+    return pd.concat(list(generate_chunks(n_rows, seed=seed, nan_rate=nan_rate)),
+                     ignore_index=True)
+
+
+def _write_csv_chunk(chunk, output, header):
+    """Write (``header``) or append a chunk, with pyarrow's CSV writer when installed"""
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        chunk.to_csv(output, mode="w" if header else "a", header=header, index=False)
+        return
+    with open(output, "wb" if header else "ab") as f:
+        pa_csv.write_csv(pa.Table.from_pandas(chunk, preserve_index=False), f,
+                         pa_csv.WriteOptions(include_header=header))
+
+
+def write_dataset(n_rows, output, seed=42, chunk_size=1_000_000, fmt=None, nan_rate=0.0):
+    """
+    Write synthetic rows to CSV or Parquet chunk by chunk
+
+    CSV output is a single file. Parquet output is a directory of
+    ``part-NNNNN.parquet`` files, readable with ``pd.read_parquet(output)``.
+    Parquet is the faster format to write. CSV is written with pyarrow when it
+    is installed, at about half the Parquet rate; without pyarrow it falls back
+    to ``DataFrame.to_csv``, which is several times slower again.
+
+    Args:
+        n_rows (int): Number of rows
+        output (Path): Destination file (CSV) or directory (Parquet)
+        seed (int): Random seed
+        chunk_size (int): Rows generated and written at a time
+        fmt (str, optional): ``"csv"`` or ``"parquet"``, inferred from ``output`` if None
+        nan_rate (float): Fraction of measurements set to NaN
+
+    Returns:
+        Path: The written file or directory
+
+    Raises:
+        DataIngestionError: If the output format is unsupported or writing fails
+    """
+    logger = logging.getLogger(__name__)
+    output = Path(output)
+    fmt = fmt or ("parquet" if output.suffix in (".parquet", ".pq") else "csv")
+    if fmt not in ("csv", "parquet"):
+        raise DataIngestionError(f"Unsupported synthetic data format: {fmt}")
+
+    try:
+        if fmt == "parquet":
+            output.mkdir(parents=True, exist_ok=True)
+        else:
+            output.parent.mkdir(parents=True, exist_ok=True)
+        chunks = generate_chunks(n_rows, seed=seed, chunk_size=chunk_size, nan_rate=nan_rate)
+        for index, chunk in enumerate(chunks):
+            if fmt == "parquet":
+                chunk.to_parquet(output / f"part-{index:05d}.parquet", index=False)
+            else:
+                _write_csv_chunk(chunk, output, header=index == 0)
+            logger.debug("Wrote chunk %d (%d rows)", index, len(chunk))
+    except ImportError as e:
+        raise DataIngestionError(f"Parquet output requires pyarrow or fastparquet: {e}")
+    except OSError as e:
+        raise DataIngestionError(f"Failed to write synthetic data: {e}")
+
+    logger.info("Wrote %d synthetic rows to %s", n_rows, output)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic diabetes data")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--output", type=Path, default=Path("data/synthetic.parquet"))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "parquet"], default=None)
+    parser.add_argument("--nan-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    write_dataset(args.rows, args.output, seed=args.seed, chunk_size=args.chunk_size,
+                  fmt=args.format, nan_rate=args.nan_rate)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {args.rows:,} rows to {args.output} in {elapsed:.1f}s "
+          f"({args.rows / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
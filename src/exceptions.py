@@ -29,6 +29,11 @@ class ModelPredictionError(DiabetesMLOpsException):
     pass
 
 
+class InferenceOverloadError(ModelPredictionError):
+    """Exception raised when the inference pool is saturated"""
+    pass
+
+
 class ConfigurationError(DiabetesMLOpsException):
     """Exception raised for configuration errors"""
     pass
\ No newline at end of file
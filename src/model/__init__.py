@@ -4,5 +4,21 @@ Machine learning model training and prediction module.
 """
 
 from .model_trainer import train_model, save_model, load_model, predict
+from .model_factory import build_model, train_candidates, select_champion
+from .inference import InferenceExecutor
+from .calibration import CalibratedModel, calibrate_model
+from .shadow import ShadowScorer
 
-__all__ = ["train_model", "save_model", "load_model", "predict"]
\ No newline at end of file
+__all__ = [
+    "train_model",
+    "save_model",
+    "load_model",
+    "predict",
+    "build_model",
+    "train_candidates",
+    "select_champion",
+    "InferenceExecutor",
+    "CalibratedModel",
+    "calibrate_model",
+    "ShadowScorer",
+]
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Probability calibration and operating threshold selection.
+
+Calibration is fitted once at training time and stored as a small lookup
+table, so serving only needs a single ``np.interp`` per batch.
+"""
+
+import logging
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import precision_recall_curve
+from sklearn.model_selection import cross_val_predict
+
+from ..exceptions import ConfigurationError, ModelTrainingError
+from ..utils.instrumentation import timed
+
+
+class CalibratedModel:
+    """
+    A fitted estimator plus its calibration table and decision threshold
+
+    Exposes ``predict`` and ``predict_proba`` so it can be used wherever the
+    bare estimator was.
+    """
+
+    def __init__(self, estimator, calibration_x, calibration_y, threshold, method="platt"):
+        """
+        Args:
+            estimator: Fitted classifier with ``predict_proba``
+            calibration_x (np.ndarray): Increasing raw scores of the lookup table
+            calibration_y (np.ndarray): Calibrated probabilities at ``calibration_x``
+            threshold (float): Calibrated probability at or above which to predict 1
+            method (str): Calibration method used to build the table
+        """
+        self.estimator = estimator
+        self.calibration_x = np.asarray(calibration_x, dtype=np.float64)
+        self.calibration_y = np.asarray(calibration_y, dtype=np.float64)
+        self.threshold = float(threshold)
+        self.method = method
+
+    def calibrate(self, raw_scores):
+        """Map raw positive-class scores to calibrated probabilities"""
+        return np.interp(raw_scores, self.calibration_x, self.calibration_y)
+
+    def predict_proba(self, X):
+        positive = self.calibrate(self.estimator.predict_proba(X)[:, 1])
+        return np.column_stack([1 - positive, positive])
+
+    def predict(self, X):
+        return (self.predict_proba(X)[:, 1] >= self.threshold).astype(int)
+
+    def to_dict(self):
+        """Return the method, threshold and lookup table as plain JSON types"""
+        return {
+            "method": self.method,
+            "threshold": self.threshold,
+            "calibration_x": self.calibration_x.tolist(),
+            "calibration_y": self.calibration_y.tolist(),
+        }
+
+
+def fit_calibration(raw_scores, y, method="platt", n_points=101):
+    """
+    Fit a calibration map and return it as a lookup table
+
+    Isotonic regression is already piecewise linear, so its breakpoints are
+    stored exactly. Platt scaling is sampled at ``n_points`` evenly spaced scores.
+
+    Args:
+        raw_scores (np.ndarray): Uncalibrated positive-class probabilities
+        y (np.ndarray): True labels
+        method (str): ``"platt"`` or ``"isotonic"``
+        n_points (int): Table size for Platt scaling
+
+    Returns:
+        tuple: (table x, table y), both increasing in x
+
+    Raises:
+        ConfigurationError: If the method is unknown
+    """
+    raw_scores = np.asarray(raw_scores, dtype=np.float64)
+    y = np.asarray(y)
+
+    if method == "isotonic":
+        iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip").fit(raw_scores, y)
+        return iso.X_thresholds_, iso.y_thresholds_
+    if method == "platt":
+        # Unregularized: the two Platt parameters should fit the calibration scores exactly
+        platt = LogisticRegression(C=np.inf).fit(raw_scores.reshape(-1, 1), y)
+        grid = np.linspace(0.0, 1.0, n_points)
+        return grid, platt.predict_proba(grid.reshape(-1, 1))[:, 1]
+    raise ConfigurationError(f"Unknown calibration method '{method}'")
+
+
+def select_threshold(probabilities, y, target_recall):
+    """
+    Pick the highest threshold whose recall meets the target
+
+    The highest such threshold has the best precision among those meeting
+    the recall target.
+
+    Args:
+        probabilities (np.ndarray): Calibrated positive-class probabilities
+        y (np.ndarray): True labels
+        target_recall (float): Minimum recall to achieve
+
+    Returns:
+        float: Decision threshold
+
+    Raises:
+        ModelTrainingError: If the held-out data has no positive examples
+    """
+    if not np.any(np.asarray(y) == 1):
+        raise ModelTrainingError("Cannot select a threshold without positive examples")
+    _, recall, thresholds = precision_recall_curve(y, probabilities)
+    # recall[i] is achieved at thresholds[i]; recall is non-increasing in the threshold
+    meeting = np.flatnonzero(recall[:-1] >= target_recall)
+    return float(thresholds[meeting[-1]]) if len(meeting) else float(thresholds[0])
+
+
+@timed("calibrate_model")
+def calibrate_model(model, X, y, method="platt", target_recall=0.8, n_points=101, cv=None):
+    """
+    Calibrate a fitted model and choose its operating threshold
+
+    With ``cv`` folds, ``X, y`` is the data the model was fitted on, and the
+    calibration map and threshold are fitted on out-of-fold scores from
+    unfitted copies of the model. Every training row is used once for
+    calibration and the model itself is not refit. Without ``cv``, ``X, y``
+    must be held-out data the model has not seen.
+
+    Platt scaling fits only two parameters, so it suits small datasets;
+    isotonic regression overfits below about a thousand calibration rows.
+
+    Args:
+        model: Fitted classifier with ``predict_proba``
+        X, y: Training data (with ``cv``) or held-out data (without)
+        method (str): ``"platt"`` or ``"isotonic"``
+        target_recall (float): Recall the threshold must achieve on the calibration scores
+        n_points (int): Table size for Platt scaling
+        cv (int, optional): Number of cross-validation folds
+
+    Returns:
+        CalibratedModel: Model bundle to save and serve
+    """
+    logger = logging.getLogger(__name__)
+
+    if cv:
+        raw_scores = cross_val_predict(clone(model), X, y, cv=cv, method="predict_proba")[:, 1]
+    else:
+        raw_scores = model.predict_proba(X)[:, 1]
+    table_x, table_y = fit_calibration(raw_scores, y, method, n_points)
+    calibrated = np.interp(raw_scores, table_x, table_y)
+    threshold = select_threshold(calibrated, y, target_recall)
+
+    logger.info("Calibrated with %s on %d %s scores (%d table points); "
+                "threshold %.3f for recall >= %.2f",
+                method, len(raw_scores), "out-of-fold" if cv else "held-out",
+                len(table_x), threshold, target_recall)
+    return CalibratedModel(model, table_x, table_y, threshold, method)
@@ -0,0 +1,369 @@
+"""
+Bounded, concurrency-controlled inference around ``load_model`` and ``predict``.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from threadpoolctl import threadpool_limits
+
+from ..constants import MODEL_FILE, PROJECT_ROOT
+from ..exceptions import InferenceOverloadError, ModelPredictionError
+from ..utils.common import load_config
+from ..utils.instrumentation import REGISTRY, buffer_stages, drain_stages, record_stage
+from ..utils.logging_utils import configure_worker_logging, forward_worker_logs
+from .calibration import CalibratedModel
+from .model_trainer import load_model, predict
+from .shadow import ShadowScorer
+
+
+# Native thread pools that would otherwise each spawn one thread per core
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+IN_FLIGHT = REGISTRY.gauge(
+    "diabetes_inference_in_flight", "Requests admitted to the inference pool"
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "diabetes_inference_queue_depth", "Admitted requests waiting for a worker"
+)
+SATURATION = REGISTRY.gauge(
+    "diabetes_inference_saturation", "Fraction of inference workers busy"
+)
+REJECTED = REGISTRY.counter(
+    "diabetes_inference_rejected_total", "Requests rejected because the queue was full"
+)
+QUEUE_WAIT = REGISTRY.histogram(
+    "diabetes_inference_queue_wait_seconds", "Time requests spent waiting for a worker"
+)
+
+# Model and thread limits held by each worker process, set by the pool initializer
+_worker_model = None
+_worker_limits = None
+
+# OpenMP limits held by each worker thread, set by the thread pool initializer
+_thread_limits = threading.local()
+
+
+def limit_native_threads(threads):
+    """
+    Cap BLAS/OpenMP threads for the current process
+
+    Also exports the ``*_NUM_THREADS`` variables so that libraries loaded
+    later, and any children, pick up the cap. Only call this in a process
+    the executor owns.
+
+    Returns:
+        threadpool_limits: Handle keeping the limit active
+    """
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    return threadpool_limits(limits=threads)
+
+
+def _single_threaded(model):
+    """Force sklearn's own ``n_jobs`` to 1 so requests do not fan out further"""
+    estimator = model.estimator if isinstance(model, CalibratedModel) else model
+    n_jobs_params = {key: 1 for key in estimator.get_params() if key.split("__")[-1] == "n_jobs"}
+    if n_jobs_params:
+        estimator.set_params(**n_jobs_params)
+    return model
+
+
+def _init_thread_worker(threads):
+    # OpenMP thread counts are per calling thread, so each worker sets its own
+    _thread_limits.handle = threadpool_limits(limits=threads, user_api="openmp")
+
+
+def _init_process_worker(filepath, threads, log_queue, log_level):
+    global _worker_model, _worker_limits
+    configure_worker_logging(log_queue, log_level)
+    buffer_stages()
+    _worker_limits = limit_native_threads(threads)
+    _worker_model = _single_threaded(load_model(filepath))
+
+
+def _predict_in_process(input_data):
+    """Predict in a worker process
+
+    Returns:
+        tuple: (prediction, probability), and the stage runs recorded in this
+        process since the last request (including the model load) for the
+        parent to record
+    """
+    try:
+        result = predict(_worker_model, input_data)
+    except Exception as e:
+        e.stages = drain_stages()
+        raise
+    return result, drain_stages()
+
+
+class InferenceExecutor:
+    """
+    Run predictions on a bounded worker pool with backpressure
+
+    In ``thread`` mode the model is loaded once and shared by the worker
+    threads; sklearn releases the GIL in its native code, so this suits
+    small models. In ``process`` mode every worker process loads its own copy.
+    In both modes native thread pools are capped at ``threads_per_worker`` so
+    that ``workers * threads_per_worker`` stays within the available cores.
+    In thread mode the OpenMP cap is set inside every worker thread and the
+    process-wide BLAS cap is restored by ``shutdown``. In process mode worker
+    log records are forwarded to this process's logging setup, and worker
+    stage timings are returned with each result and recorded here.
+
+    At most ``workers + max_queue`` requests are admitted at once. Further
+    submissions wait up to ``submit_timeout`` seconds for a slot and are then
+    rejected with ``InferenceOverloadError``.
+
+    If a ``ShadowScorer`` is given, every answered request is mirrored to it
+    once its result is available to the caller.
+    """
+
+    def __init__(self, filepath=None, workers=2, mode="thread", threads_per_worker=1,
+                 max_queue=32, submit_timeout=0.0, shadow=None):
+        """
+        Args:
+            filepath: Model path relative to the project root (MODEL_FILE if None)
+            workers (int): Worker threads or processes
+            mode (str): ``"thread"`` or ``"process"``
+            threads_per_worker (int): BLAS/OpenMP threads per worker
+            max_queue (int): Requests allowed to wait for a worker
+            submit_timeout (float): Seconds to wait for a slot before rejecting
+            shadow (ShadowScorer, optional): Scorer that mirrored requests are sent to
+
+        Raises:
+            ModelPredictionError: If the model cannot be loaded
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown inference mode '{mode}'")
+
+        self.workers = workers
+        self.mode = mode
+        self.max_queue = max_queue
+        self.submit_timeout = submit_timeout
+        self.shadow = shadow
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._busy = 0
+        self._completed = 0
+        self._rejected = 0
+
+        self._limits = None
+        self._log_listener = None
+        if mode == "thread":
+            self._model = _single_threaded(load_model(filepath))
+            self._limits = threadpool_limits(limits=threads_per_worker, user_api="blas")
+            self._pool = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="inference",
+                initializer=_init_thread_worker,
+                initargs=(threads_per_worker,),
+            )
+        else:
+            model_path = MODEL_FILE if filepath is None else PROJECT_ROOT / filepath
+            if not model_path.exists():
+                raise ModelPredictionError(f"Model loading failed: {model_path} not found")
+            self._model = None
+            log_queue = multiprocessing.Queue()
+            self._log_listener = forward_worker_logs(log_queue)
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_process_worker,
+                initargs=(filepath, threads_per_worker, log_queue,
+                          logging.getLogger().getEffectiveLevel()),
+            )
+
+    @classmethod
+    def from_config(cls, filepath=None):
+        """
+        Create an executor from the ``serving`` section of params.yaml
+
+        The primary model is loaded first. A shadow model that fails to load
+        is logged and skipped, so it can never take primary serving down.
+
+        Raises:
+            ModelPredictionError: If the primary model cannot be loaded
+        """
+        serving = load_config().get("serving", {})
+        executor = cls(
+            filepath=filepath,
+            workers=serving.get("workers", 2),
+            mode=serving.get("mode", "thread"),
+            threads_per_worker=serving.get("threads_per_worker", 1),
+            max_queue=serving.get("max_queue", 32),
+            submit_timeout=serving.get("submit_timeout", 0.0),
+        )
+        if serving.get("shadow_model"):
+            try:
+                executor.shadow = ShadowScorer(
+                    serving["shadow_model"],
+                    batch_size=serving.get("shadow_batch_size", 64),
+                    max_queue=serving.get("shadow_max_queue", 1024),
+                    sample_rate=serving.get("shadow_sample_rate", 1.0),
+                )
+            except Exception as e:
+                logging.getLogger(__name__).warning(
+                    "Shadow model %s not loaded, serving without it: %s",
+                    serving["shadow_model"], e,
+                )
+        return executor
+
+    def _update_gauges(self):
+        # Called with self._lock held
+        IN_FLIGHT.set(self._in_flight)
+        QUEUE_DEPTH.set(self._in_flight - self._busy)
+        SATURATION.set(self._busy / self.workers)
+
+    def _run_in_thread(self, input_data, enqueued):
+        with self._lock:
+            self._busy += 1
+            self._update_gauges()
+        QUEUE_WAIT.observe(time.perf_counter() - enqueued)
+        try:
+            return predict(self._model, input_data)
+        finally:
+            with self._lock:
+                self._busy -= 1
+                self._update_gauges()
+
+    def _resolve(self, done, future, submitted):
+        # Unpack a worker's (result, stages) reply; runs on the pool's result thread
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result, stages = done.result()
+        except Exception as e:
+            for stage in getattr(e, "stages", []):
+                record_stage(*stage)
+            future.set_exception(e)
+            return
+        busy = 0.0
+        for stage, seconds, error in stages:
+            record_stage(stage, seconds, error)
+            busy += seconds
+        # What the worker did not spend on the request was spent waiting for it
+        QUEUE_WAIT.observe(max(0.0, time.perf_counter() - submitted - busy))
+        future.set_result(result)
+
+    def _on_done(self, future):
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+            if self.mode == "process":
+                self._busy = min(self._in_flight, self.workers)
+            self._update_gauges()
+        self._slots.release()
+
+    def _mirror(self, future, input_data):
+        # Runs after the caller has been handed the result
+        if not future.cancelled() and future.exception() is None:
+            prediction, probability = future.result()
+            self.shadow.submit(input_data, prediction, probability)
+
+    def submit(self, input_data):
+        """
+        Queue a prediction
+
+        Args:
+            input_data: Input features as numpy array
+
+        Returns:
+            concurrent.futures.Future: Resolves to (prediction, probability)
+
+        Raises:
+            InferenceOverloadError: If no slot frees up within ``submit_timeout``
+        """
+        if self.submit_timeout:
+            admitted = self._slots.acquire(timeout=self.submit_timeout)
+        else:
+            admitted = self._slots.acquire(blocking=False)
+        if not admitted:
+            with self._lock:
+                self._rejected += 1
+            REJECTED.inc()
+            raise InferenceOverloadError(
+                f"Inference queue full ({self.workers} workers, {self.max_queue} queued)"
+            )
+
+        with self._lock:
+            self._in_flight += 1
+            if self.mode == "process":
+                # Busy workers are not observable across processes; infer them
+                self._busy = min(self._in_flight, self.workers)
+            self._update_gauges()
+
+        try:
+            if self.mode == "thread":
+                future = self._pool.submit(self._run_in_thread, input_data, time.perf_counter())
+            else:
+                future = Future()
+                submitted = time.perf_counter()
+                self._pool.submit(_predict_in_process, input_data).add_done_callback(
+                    lambda done: self._resolve(done, future, submitted)
+                )
+        except Exception:
+            self._on_done(None)
+            raise
+        future.add_done_callback(self._on_done)
+        if self.shadow is not None:
+            future.add_done_callback(lambda done: self._mirror(done, input_data))
+        return future
+
+    def predict(self, input_data, timeout=None):
+        """
+        Make a prediction through the pool, waiting for the result
+
+        Returns:
+            tuple: (prediction (0 or 1), probability)
+        """
+        return self.submit(input_data).result(timeout=timeout)
+
+    def stats(self):
+        """
+        Report pool saturation
+
+        Returns:
+            dict: workers, in_flight, busy, queue_depth, saturation, completed, rejected
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "in_flight": self._in_flight,
+                "busy": self._busy,
+                "queue_depth": self._in_flight - self._busy,
+                "saturation": self._busy / self.workers,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait=True):
+        """Stop accepting work and release the workers"""
+        self._pool.shutdown(wait=wait)
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+        if self._limits is not None:
+            self._limits.restore_original_limits()
+            self._limits = None
+        if self.shadow is not None:
+            self.shadow.close()
+        logging.getLogger(__name__).info("Inference pool shut down: %s", self.stats())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+        return False
@@ -0,0 +1,208 @@
+"""
+Candidate model construction, parallel training and champion selection.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from ..exceptions import ConfigurationError, ModelTrainingError
+
+
+def _logistic_regression(**params):
+    """Logistic regression on standardised features"""
+    return make_pipeline(StandardScaler(), LogisticRegression(**params))
+
+
+# Model name in params.yaml -> estimator constructor
+MODEL_REGISTRY = {
+    "RandomForest": RandomForestClassifier,
+    "HistGradientBoosting": HistGradientBoostingClassifier,
+    "LogisticRegression": _logistic_regression,
+}
+
+DEFAULT_SELECTION = {
+    "metric": "accuracy",
+    "max_latency_ms": None,
+    "tolerance": 0.0,
+    "latency_repeats": 200,
+}
+
+# Training split shared by every task of a worker process, set by the pool initializer
+_split = None
+
+
+def build_model(name, params=None):
+    """
+    Build an unfitted estimator from its registry name
+
+    Args:
+        name (str): Key of MODEL_REGISTRY
+        params (dict, optional): Estimator parameters
+
+    Returns:
+        Unfitted estimator
+
+    Raises:
+        ConfigurationError: If the model name is unknown
+    """
+    if name not in MODEL_REGISTRY:
+        raise ConfigurationError(
+            f"Unknown model '{name}'. Available: {sorted(MODEL_REGISTRY)}"
+        )
+    return MODEL_REGISTRY[name](**dict(params or {}))
+
+
+def evaluate_model(model, X_test, y_test):
+    """
+    Compute classification metrics on held-out data
+
+    Returns:
+        dict: accuracy, precision, recall, f1_score and roc_auc
+    """
+    y_pred = model.predict(X_test)
+    y_pred_proba = model.predict_proba(X_test)[:, 1]
+    return {
+        "accuracy": float(accuracy_score(y_test, y_pred)),
+        "precision": float(precision_score(y_test, y_pred, zero_division=0)),
+        "recall": float(recall_score(y_test, y_pred)),
+        "f1_score": float(f1_score(y_test, y_pred)),
+        "roc_auc": float(roc_auc_score(y_test, y_pred_proba)),
+    }
+
+
+def measure_latency(model, X, repeats=200):
+    """
+    Measure single-row ``predict_proba`` latency, as seen by serving
+
+    Args:
+        model: Fitted estimator
+        X: Rows to cycle through
+        repeats (int): Number of timed calls
+
+    Returns:
+        dict: p50 and p99 latency in milliseconds
+    """
+    rows = np.asarray(X)
+    model.predict_proba(rows[:1])  # warm up
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        row = rows[i % len(rows)].reshape(1, -1)
+        start = time.perf_counter()
+        model.predict_proba(row)
+        timings[i] = time.perf_counter() - start
+    timings *= 1000
+    return {
+        "latency_p50_ms": float(np.percentile(timings, 50)),
+        "latency_p99_ms": float(np.percentile(timings, 99)),
+    }
+
+
+def _init_worker(X_train, y_train, X_val, y_val):
+    global _split
+    _split = (X_train, y_train, X_val, y_val)
+
+
+def _fit_candidate(name, params):
+    """Fit and evaluate one candidate on the worker's cached split"""
+    X_train, y_train, X_val, y_val = _split
+    start = time.perf_counter()
+    model = build_model(name, params)
+    model.fit(np.asarray(X_train), np.asarray(y_train))
+    fit_seconds = time.perf_counter() - start
+    metrics = evaluate_model(model, np.asarray(X_val), np.asarray(y_val))
+    return {"name": name, "params": dict(params), "model": model,
+            "metrics": metrics, "fit_seconds": fit_seconds}
+
+
+def train_candidates(candidates, X_train, y_train, X_val, y_val, max_workers=None,
+                     latency_repeats=200):
+    """
+    Train candidate models concurrently and measure their inference latency
+
+    The split is sent once to each worker process rather than with every task.
+    Latency is measured sequentially in this process afterwards, so candidates
+    are not timed while competing with each other for cores.
+
+    Args:
+        candidates (dict): Model name -> estimator parameters
+        X_train, y_train: Training data
+        X_val, y_val: Validation data the candidates are compared on
+        max_workers (int, optional): Process pool size, defaults to one per candidate
+        latency_repeats (int): Timed calls per candidate
+
+    Returns:
+        list: One dict per candidate with name, params, model, metrics and fit_seconds
+
+    Raises:
+        ModelTrainingError: If a candidate fails to train
+    """
+    logger = logging.getLogger(__name__)
+    for name in candidates:
+        if name not in MODEL_REGISTRY:
+            raise ConfigurationError(
+                f"Unknown model '{name}'. Available: {sorted(MODEL_REGISTRY)}"
+            )
+
+    if max_workers is None:
+        max_workers = min(len(candidates), os.cpu_count() or 1)
+    split = tuple(np.asarray(a) for a in (X_train, y_train, X_val, y_val))
+
+    logger.info("Training %d candidate models with %d workers", len(candidates), max_workers)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=split) as pool:
+            futures = [pool.submit(_fit_candidate, name, params or {})
+                       for name, params in candidates.items()]
+            results = [future.result() for future in futures]
+    except Exception as e:
+        logger.error("Candidate training failed: %s", e)
+        raise ModelTrainingError(f"Candidate training failed: {e}")
+
+    for result in results:
+        result["metrics"].update(measure_latency(result["model"], split[2], latency_repeats))
+        logger.info("Candidate %s: %s", result["name"], result["metrics"])
+    return results
+
+
+def select_champion(results, selection=None):
+    """
+    Pick the model to promote under an accuracy-versus-latency budget
+
+    Candidates whose p99 latency exceeds ``max_latency_ms`` are discarded. Of
+    the rest, every candidate within ``tolerance`` of the best ``metric`` is
+    considered good enough, and the fastest of those wins.
+
+    Args:
+        results (list): Output of ``train_candidates``
+        selection (dict, optional): metric, max_latency_ms and tolerance
+
+    Returns:
+        dict: The champion's result entry
+
+    Raises:
+        ModelTrainingError: If no candidate fits the latency budget
+    """
+    selection = {**DEFAULT_SELECTION, **dict(selection or {})}
+    metric = selection["metric"]
+    max_latency = selection["max_latency_ms"]
+
+    eligible = [r for r in results
+                if max_latency is None or r["metrics"]["latency_p99_ms"] <= max_latency]
+    if not eligible:
+        raise ModelTrainingError(
+            f"No candidate meets the {max_latency} ms p99 latency budget"
+        )
+
+    best_score = max(r["metrics"][metric] for r in eligible)
+    contenders = [r for r in eligible
+                  if r["metrics"][metric] >= best_score - selection["tolerance"]]
+    return min(contenders, key=lambda r: r["metrics"]["latency_p99_ms"])
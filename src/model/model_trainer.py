@@ -3,9 +3,7 @@
 Machine learning model training and prediction module.
 """
 
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
+import contextlib
 import joblib
 import mlflow
 import mlflow.sklearn
@@ -15,59 +13,101 @@ import numpy as np
 from ..utils.common import load_config
 from ..constants import MODEL_FILE, DEFAULT_MODEL_PARAMS
 from ..exceptions import ModelTrainingError, ModelPredictionError
+from ..utils.instrumentation import timed
+from .model_factory import build_model, train_candidates, select_champion
+from .calibration import CalibratedModel
 
-def train_model(X_train, y_train, X_test, y_test):
+# High-frequency per-request events; sampled via ``logging.sampling`` in params.yaml
+prediction_logger = logging.getLogger(f"{__package__}.predictions")
+
+@timed("train_model")
+def train_model(X_train, y_train, X_val, y_val):
     """
-    Train the model and log metrics with MLflow
+    Train the candidate models and log metrics with MLflow
+
+    Every candidate in ``model.candidates`` is trained concurrently on the same
+    split, and the champion is chosen against the ``model.selection`` budget
+    on the validation data. The champion is then refit on the training and
+    validation data together. Without candidates, only ``model.name`` is trained.
+
     Args:
         X_train, y_train: Training data
-        X_test, y_test: Test data
+        X_val, y_val: Validation data carved from the training split; never the test set
     Returns:
-        trained model
+        trained champion model
     """
     logger = logging.getLogger(__name__)
     config = load_config()
+    model_config = config["model"]
+
+    candidates = model_config.get("candidates") or {model_config["name"]: model_config["params"]}
+    selection = model_config.get("selection", {})
 
     # Set MLflow experiment
     mlflow.set_experiment(config["mlflow"]["experiment_name"])
 
-    with mlflow.start_run():
-        # Get model parameters
-        model_params = config["model"]["params"]
+    # Join the caller's run (the training pipeline's) if there is one
+    run = mlflow.start_run() if mlflow.active_run() is None else contextlib.nullcontext()
+    with run:
+        # Train candidates
+        results = train_candidates(
+            candidates, X_train, y_train, X_val, y_val,
+            max_workers=model_config.get("max_workers"),
+            latency_repeats=selection.get("latency_repeats", 200),
+        )
+
+        # Log every candidate as a nested run for side-by-side comparison
+        for result in results:
+            with mlflow.start_run(run_name=result["name"], nested=True):
+                mlflow.log_params(result["params"])
+                mlflow.log_metrics(dict(result["metrics"], fit_seconds=result["fit_seconds"]))
+
+        # Pick the champion and refit it on all the data it may see
+        champion = select_champion(results, selection)
+        model = build_model(champion["name"], champion["params"]).fit(
+            np.concatenate([np.asarray(X_train), np.asarray(X_val)]),
+            np.concatenate([np.asarray(y_train), np.asarray(y_val)]),
+        )
+
+        # Log parameters and validation metrics; test metrics are logged by the pipeline
+        mlflow.log_param("champion", champion["name"])
+        mlflow.log_params(champion["params"])
+        mlflow.log_metrics({
+            key if key.startswith("latency") else f"val_{key}": value
+            for key, value in champion["metrics"].items()
+        })
+
+        # Log the uncalibrated champion; "model" is reserved for what save_model serves
+        log_mlflow_model(model, "champion")
+
+        logger.info("Champion %s selected. Metrics: %s", champion["name"], champion["metrics"])
 
-        # Train model
-        logger.info("Training Random Forest model...")
-        model = RandomForestClassifier(**model_params)
-        model.fit(X_train, y_train)
-
-        # Make predictions
-        y_pred = model.predict(X_test)
-        y_pred_proba = model.predict_proba(X_test)[:, 1]
-
-        # Calculate metrics
-        metrics = {
-            "accuracy": accuracy_score(y_test, y_pred),
-            "precision": precision_score(y_test, y_pred),
-            "recall": recall_score(y_test, y_pred),
-            "f1_score": f1_score(y_test, y_pred),
-            "roc_auc": roc_auc_score(y_test, y_pred_proba)
-        }
-
-        # Log parameters and metrics
-        mlflow.log_params(model_params)
-        mlflow.log_metrics(metrics)
+        return model
 
-        # Log model
-        mlflow.sklearn.log_model(model, "model")
+def log_mlflow_model(model, artifact_path):
+    """
+    Log a model or CalibratedModel bundle as an MLflow model in the active run
 
-        logger.info(f"Model trained successfully. Metrics: {metrics}")
+    skops (the MLflow default) rejects HistGradientBoosting's TreePredictor, and
+    MODEL_FILE is a pickle already, so the model is logged with cloudpickle.
 
-        return model
+    Args:
+        model: Trained model or CalibratedModel bundle
+        artifact_path: Run-relative path, e.g. ``"model"``
+    """
+    mlflow.sklearn.log_model(
+        model, artifact_path,
+        serialization_format=mlflow.sklearn.SERIALIZATION_FORMAT_CLOUDPICKLE,
+    )
 
+@timed("save_model")
 def save_model(model, filepath=None):
     """
     Save the trained model
 
+    The same model is logged as the MLflow model at ``runs:/<id>/model``, so
+    loading it from MLflow gives the predictions that serving gives.
+
     Args:
         model: Trained model
         filepath: Path to save the model (relative to project root)
@@ -87,15 +127,16 @@ def save_model(model, filepath=None):
         # Create models directory if it doesn't exist
         filepath.parent.mkdir(exist_ok=True)
         joblib.dump(model, filepath)
-        logger.info(f"Model saved to {filepath}")
+        logger.info("Model saved to %s", filepath)
     except Exception as e:
-        logger.error(f"Failed to save model: {e}")
+        logger.error("Failed to save model: %s", e)
         raise ModelTrainingError(f"Model saving failed: {e}")
 
     joblib.dump(model, filepath)
-    logger.info(f"Model saved to {filepath}")
+    logger.info("Model saved to %s", filepath)
 
     # Log model artifact in MLflow
+    log_mlflow_model(model, "model")
     mlflow.log_artifact(filepath, "model")
 
 def save_metrics(metrics, filepath="metrics.json"):
@@ -113,6 +154,7 @@ def save_metrics(metrics, filepath="metrics.json"):
     mlflow.log_metrics(metrics)
     mlflow.log_artifact(filepath, "metrics")
 
+@timed("load_model")
 def load_model(filepath=None):
     """
     Load a saved model
@@ -134,28 +176,39 @@ def load_model(filepath=None):
 
     try:
         model = joblib.load(filepath)
-        logging.getLogger(__name__).info(f"Model loaded from {filepath}")
+        logging.getLogger(__name__).info("Model loaded from %s", filepath)
         return model
     except Exception as e:
-        logging.getLogger(__name__).error(f"Failed to load model: {e}")
+        logging.getLogger(__name__).error("Failed to load model: %s", e)
         raise ModelPredictionError(f"Model loading failed: {e}")
 
 
+@timed("predict")
 def predict(model, input_data):
     """
     Make predictions with the model
 
+    Calibrated models apply their stored threshold to the calibrated
+    probability, so the model is only evaluated once.
+
     Args:
-        model: Trained model
+        model: Trained model or CalibratedModel bundle
         input_data: Input features as numpy array
 
     Returns:
         tuple: (prediction (0 or 1), probability)
     """
     try:
-        prediction = model.predict(input_data)[0]
         probability = model.predict_proba(input_data)[0][1]
+        if isinstance(model, CalibratedModel):
+            prediction = probability >= model.threshold
+        else:
+            prediction = model.predict(input_data)[0]
+        prediction_logger.info(
+            "Prediction made",
+            extra={"prediction": int(prediction), "probability": float(probability)},
+        )
         return int(prediction), float(probability)
     except Exception as e:
-        logging.getLogger(__name__).error(f"Failed to make prediction: {e}")
+        logging.getLogger(__name__).error("Failed to make prediction: %s", e)
         raise ModelPredictionError(f"Prediction failed: {e}")
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+Shadow scoring of a candidate model on mirrored live traffic.
+
+Requests are mirrored into a bounded queue after the primary response is
+ready and scored in batches by a background thread, so the primary path only
+pays for a non-blocking ``put``. When the queue is full, mirrored requests are
+dropped rather than slowing the primary model down. The scoring thread caps
+its own OpenMP threads at one so batches do not compete with the primary
+workers for every core.
+"""
+
+import logging
+import queue
+import random
+import threading
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+from ..utils.instrumentation import REGISTRY
+from .calibration import CalibratedModel
+from .model_trainer import load_model
+
+
+SHADOW_SCORED = REGISTRY.counter(
+    "diabetes_shadow_scored_total", "Mirrored requests scored by the shadow model"
+)
+SHADOW_AGREED = REGISTRY.counter(
+    "diabetes_shadow_agreed_total", "Mirrored requests where shadow and primary agreed"
+)
+SHADOW_DROPPED = REGISTRY.counter(
+    "diabetes_shadow_dropped_total", "Mirrored requests dropped because the queue was full"
+)
+SHADOW_DELTA = REGISTRY.histogram(
+    "diabetes_shadow_probability_delta",
+    "Absolute difference between shadow and primary probabilities",
+    buckets=(0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0),
+)
+
+def score_batch(model, X):
+    """
+    Score a batch with one ``predict_proba`` call where possible
+
+    Returns:
+        tuple: (predictions, positive-class probabilities) as arrays
+    """
+    probabilities = model.predict_proba(X)[:, 1]
+    if isinstance(model, CalibratedModel):
+        predictions = (probabilities >= model.threshold).astype(int)
+    else:
+        predictions = model.predict(X)
+    return predictions, probabilities
+
+
+class ShadowScorer:
+    """
+    Score mirrored requests with a shadow model and compare to the primary
+    """
+
+    def __init__(self, filepath, batch_size=64, max_queue=1024, flush_interval=0.5,
+                 sample_rate=1.0):
+        """
+        Args:
+            filepath: Shadow model path (relative to project root)
+            batch_size (int): Maximum requests scored per ``predict_proba`` call
+            max_queue (int): Mirrored requests buffered before dropping
+            flush_interval (float): Seconds to wait for a batch to fill
+            sample_rate (float): Fraction of requests to mirror
+
+        Raises:
+            ModelPredictionError: If the shadow model cannot be loaded
+        """
+        self.model = load_model(filepath)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_rate = sample_rate
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._scored = 0
+        self._agreed = 0
+        self._dropped = 0
+        self._errors = 0
+        self._sum_abs_delta = 0.0
+        self._max_abs_delta = 0.0
+        self._thread = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+        self._thread.start()
+
+    def submit(self, input_data, prediction, probability):
+        """
+        Mirror a request that the primary model has already answered
+
+        Never blocks: if the queue is full the request is dropped and counted.
+        Only ``sample_rate`` of the requests are mirrored.
+
+        Args:
+            input_data: Input features as numpy array (one row)
+            prediction (int): Primary model prediction
+            probability (float): Primary model probability
+        """
+        if self._stop.is_set():
+            return
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        try:
+            self._queue.put_nowait((input_data, prediction, probability))
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            SHADOW_DROPPED.inc()
+
+    def _next_batch(self):
+        """Block for one item, then take whatever else is queued up to batch_size"""
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        logger = logging.getLogger(__name__)
+        # OpenMP limits apply to the calling thread only, so the primary is unaffected
+        with threadpool_limits(limits=1, user_api="openmp"):
+            while not (self._stop.is_set() and self._queue.empty()):
+                items = self._next_batch()
+                if not items:
+                    continue
+                try:
+                    self._compare(items)
+                except Exception as e:
+                    with self._lock:
+                        self._errors += len(items)
+                    logger.warning("Shadow scoring failed for %d requests: %s", len(items), e)
+
+    def _compare(self, items):
+        X = np.vstack([np.asarray(input_data).reshape(1, -1) for input_data, _, _ in items])
+        primary_predictions = np.array([prediction for _, prediction, _ in items])
+        primary_probabilities = np.array([probability for _, _, probability in items])
+
+        shadow_predictions, shadow_probabilities = score_batch(self.model, X)
+        agreed = int(np.sum(shadow_predictions == primary_predictions))
+        deltas = np.abs(shadow_probabilities - primary_probabilities)
+
+        with self._lock:
+            self._scored += len(items)
+            self._agreed += agreed
+            self._sum_abs_delta += float(deltas.sum())
+            self._max_abs_delta = max(self._max_abs_delta, float(deltas.max()))
+        SHADOW_SCORED.inc(len(items))
+        SHADOW_AGREED.inc(agreed)
+        for delta in deltas:
+            SHADOW_DELTA.observe(float(delta))
+
+    def stats(self):
+        """
+        Report the comparison so far
+
+        Returns:
+            dict: scored, dropped, errors, pending, agreement_rate, mean_abs_delta, max_abs_delta
+        """
+        with self._lock:
+            scored = self._scored
+            return {
+                "scored": scored,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "pending": self._queue.qsize(),
+                "agreement_rate": self._agreed / scored if scored else None,
+                "mean_abs_delta": self._sum_abs_delta / scored if scored else None,
+                "max_abs_delta": self._max_abs_delta if scored else None,
+            }
+
+    def close(self, timeout=5.0):
+        """
+        Stop mirroring, score what is already queued and stop the background thread
+
+        Never raises; if the queue is not drained within ``timeout`` seconds the
+        daemon thread is left to finish on its own.
+        """
+        logger = logging.getLogger(__name__)
+        self._stop.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Shadow scorer still draining after %.1fs", timeout)
+        logger.info("Shadow scoring stopped: %s", self.stats())
@@ -5,11 +5,29 @@ ML pipeline orchestration module.
 
 from ..data.data_ingestion import ingest_data, validate_data
 from ..model.model_trainer import train_model, save_model
+from ..model.model_factory import evaluate_model
+from ..model.calibration import calibrate_model
 import logging
 from pathlib import Path
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
 from ..utils.common import load_config, setup_logging, get_project_root
+from ..utils.instrumentation import timed, write_profile_report
+import mlflow
+
+
+def save_profile_report(filepath="profile_report.json"):
+    """
+    Save the per-stage timing report to JSON and log it in MLflow
+
+    Args:
+        filepath: Path to save the report
+
+    Returns:
+        dict: Stage name to count, total, mean and max duration
+    """
+    report = write_profile_report(filepath)
+    mlflow.log_artifact(filepath, "profile")
+    return report
 
 def run_training_pipeline():
     """
@@ -22,56 +40,85 @@ def run_training_pipeline():
         # Load configuration
         config = load_config()
 
-        # Ingest data
-        df = ingest_data()
-
-        # Validate data
-        if not validate_data(df):
-            raise ValueError("Data validation failed")
-
-        # Prepare features and target
-        feature_columns = ["Pregnancies", "Glucose", "BloodPressure", "BMI", "Age"]
-        X = df[feature_columns]
-        y = df["Outcome"]
-
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y,
-            test_size=config["data"]["test_size"],
-            random_state=config["data"]["random_state"]
-        )
-
-        logger.info(f"Training data shape: {X_train.shape}")
-        logger.info(f"Test data shape: {X_test.shape}")
-
-        # Train model
-        model = train_model(X_train, y_train, X_test, y_test)
-
-        # Save model
-        save_model(model)
-
-        # Save metrics
-        from src.model.model_trainer import save_metrics
-        # Recalculate metrics for saving
-        y_pred = model.predict(X_test)
-        y_pred_proba = model.predict_proba(X_test)[:, 1]
-        metrics = {
-            "accuracy": float(accuracy_score(y_test, y_pred)),
-            "precision": float(precision_score(y_test, y_pred)),
-            "recall": float(recall_score(y_test, y_pred)),
-            "f1_score": float(f1_score(y_test, y_pred)),
-            "roc_auc": float(roc_auc_score(y_test, y_pred_proba))
-        }
-        save_metrics(metrics)
+        # Log training, calibration and the saved bundle to a single run
+        mlflow.set_experiment(config["mlflow"]["experiment_name"])
+        with mlflow.start_run():
+            # Ingest data
+            df = ingest_data()
+
+            # Validate data
+            if not validate_data(df):
+                raise ValueError("Data validation failed")
+
+            # Prepare features and target
+            feature_columns = ["Pregnancies", "Glucose", "BloodPressure", "BMI", "Age"]
+            X = df[feature_columns]
+            y = df["Outcome"]
+
+            # Split data
+            with timed("split_data"):
+                X_train, X_test, y_train, y_test = train_test_split(
+                    X, y,
+                    test_size=config["data"]["test_size"],
+                    random_state=config["data"]["random_state"]
+                )
+
+                # Compare candidates on a validation slice so the test set stays unseen
+                X_fit, X_val, y_fit, y_val = train_test_split(
+                    X_train, y_train,
+                    test_size=config["model"]["selection"]["validation_size"],
+                    random_state=config["data"]["random_state"],
+                    stratify=y_train
+                )
+
+            logger.info("Training data shape: %s", X_fit.shape)
+            logger.info("Validation data shape: %s", X_val.shape)
+            logger.info("Test data shape: %s", X_test.shape)
+
+            # Train candidates, select on validation data, refit on the whole training split
+            model = train_model(X_fit, y_fit, X_val, y_val)
+
+            # Calibrate on out-of-fold scores over the whole training split
+            calibration_config = config.get("calibration")
+            if calibration_config:
+                model = calibrate_model(
+                    model, X_train.to_numpy(), y_train.to_numpy(),
+                    method=calibration_config["method"],
+                    target_recall=calibration_config["target_recall"],
+                    n_points=calibration_config.get("n_points", 101),
+                    cv=calibration_config["cv"]
+                )
+
+                # Record the lookup table next to the uncalibrated champion
+                mlflow.log_params({
+                    "calibration_method": model.method,
+                    "target_recall": calibration_config["target_recall"],
+                })
+                mlflow.log_dict(model.to_dict(), "calibration/calibration.json")
+
+            # Save model
+            save_model(model)
+
+            # Save metrics
+            from src.model.model_trainer import save_metrics
+            # Recalculate metrics for saving
+            metrics = evaluate_model(model, X_test.to_numpy(), y_test.to_numpy())
+            if calibration_config:
+                metrics["threshold"] = model.threshold
+            save_metrics(metrics)
+
+            # Save per-stage timings
+            report = save_profile_report()
+            for stage, stats in report.items():
+                logger.info("Stage %s took %.3fs", stage, stats["total_seconds"])
 
         logger.info("Training pipeline completed successfully!")
 
     except Exception as e:
-        logger.error(f"Training pipeline failed: {e}")
+        logger.error("Training pipeline failed: %s", e)
         raise
 
 if __name__ == "__main__":
     # Setup logging
-    from src.data.data_ingestion import setup_logging
     setup_logging()
     run_training_pipeline()
\ No newline at end of file
@@ -4,5 +4,15 @@ Utility functions and configuration management.
 """
 
 from .common import load_config, setup_logging
+from .logging_utils import configure_logging, stop_logging
+from .instrumentation import REGISTRY, timed, stage_report
 
-__all__ = ["load_config", "setup_logging"]
\ No newline at end of file
+__all__ = [
+    "load_config",
+    "setup_logging",
+    "configure_logging",
+    "stop_logging",
+    "REGISTRY",
+    "timed",
+    "stage_report",
+]
\ No newline at end of file
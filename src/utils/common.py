@@ -4,11 +4,11 @@ Common utility functions for the diabetes prediction MLOps project.
 """
 
 import yaml
-import logging
 import os
 from pathlib import Path
 from box import ConfigBox
 from ensure import ensure_annotations
+from .logging_utils import configure_logging
 
 
 @ensure_annotations
@@ -34,15 +34,24 @@ def load_config() -> ConfigBox:
 
 @ensure_annotations
 def setup_logging():
-    """Setup logging configuration"""
+    """Setup logging configuration
+
+    Log records are queued and written by a background listener, so logging
+    calls never wait on the console or the rotating log file.
+
+    Returns:
+        logging.handlers.QueueListener: The running listener
+    """
     config = load_config()
-    logging.basicConfig(
-        level=getattr(logging, config["logging"]["level"]),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(config["logging"]["file"]),
-            logging.StreamHandler()
-        ]
+    log_config = config["logging"]
+    return configure_logging(
+        level=log_config["level"],
+        log_file=get_project_root() / log_config["file"],
+        fmt=log_config.get("format", "json"),
+        max_bytes=log_config.get("max_bytes", 10_485_760),
+        backup_count=log_config.get("backup_count", 5),
+        sampling=log_config.get("sampling", {}),
+        queue_size=log_config.get("queue_size", 10_000),
     )
 
 
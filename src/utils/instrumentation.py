@@ -0,0 +1,390 @@
+"""
+Lightweight timers and counters for the training and serving hot paths.
+
+Metrics live in a process-wide registry and can be rendered in the Prometheus
+text exposition format or summarised as a per-stage profile report.
+"""
+
+import bisect
+import cProfile
+import functools
+import io
+import json
+import math
+import pstats
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+# Latency buckets in seconds, from sub-millisecond predictions to multi-second training
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_labels(labels):
+    """Render a sorted label tuple as ``{key="value",...}``"""
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", r"\\").replace('"', r"\""))
+        for key, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class holding one value per label set"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name, documentation):
+        self.name = name
+        self.documentation = documentation
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    metric_type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    metric_type = "gauge"
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[tuple(sorted(labels.items()))] = value
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels):
+        return self._values.get(tuple(sorted(labels.items())), 0)
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name, documentation, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {
+                    "counts": [0] * (len(self.buckets) + 1),
+                    "sum": 0.0,
+                    "count": 0,
+                    "max": 0.0,
+                }
+            state["counts"][index] += 1
+            state["sum"] += value
+            state["count"] += 1
+            state["max"] = max(state["max"], value)
+
+    def summary(self):
+        """Return count, total, mean and max per label set
+
+        Returns:
+            dict: Mapping of label tuple to summary statistics
+        """
+        with self._lock:
+            return {
+                labels: {
+                    "count": state["count"],
+                    "total_seconds": state["sum"],
+                    "mean_seconds": state["sum"] / state["count"],
+                    "max_seconds": state["max"],
+                }
+                for labels, state in self._values.items()
+            }
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        with self._lock:
+            for labels, state in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (math.inf,), state["counts"]):
+                    cumulative += count
+                    bucket_labels = _format_labels(labels + (("le", _format_value(bound)),))
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+                label_text = _format_labels(labels)
+                lines.append(f"{self.name}_sum{label_text} {_format_value(state['sum'])}")
+                lines.append(f"{self.name}_count{label_text} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of named metrics"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name, documentation, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.metric_type}")
+            return metric
+
+    def counter(self, name, documentation):
+        return self._get_or_create(Counter, name, documentation)
+
+    def gauge(self, name, documentation):
+        return self._get_or_create(Gauge, name, documentation)
+
+    def histogram(self, name, documentation, buckets=DEFAULT_BUCKETS):
+        return self._get_or_create(Histogram, name, documentation, buckets=buckets)
+
+    def reset(self):
+        """Clear all recorded values, keeping the registered metrics"""
+        with self._lock:
+            for metric in self._metrics.values():
+                metric.reset()
+
+    def render_prometheus(self):
+        """Render every metric in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_DURATION = REGISTRY.histogram(
+    "diabetes_stage_duration_seconds", "Time spent in an instrumented stage"
+)
+STAGE_CALLS = REGISTRY.counter(
+    "diabetes_stage_calls_total", "Number of times an instrumented stage ran"
+)
+STAGE_ERRORS = REGISTRY.counter(
+    "diabetes_stage_errors_total", "Number of times an instrumented stage raised"
+)
+
+# Stage runs not yet handed to another process; see ``buffer_stages``
+_stage_buffer = None
+
+
+def record_stage(stage, seconds, error=False):
+    """Record one run of a stage, including runs timed in another process
+
+    Args:
+        stage (str): Stage name
+        seconds (float): Time the stage took
+        error (bool): Whether the stage raised
+    """
+    STAGE_DURATION.observe(seconds, stage=stage)
+    STAGE_CALLS.inc(stage=stage)
+    if error:
+        STAGE_ERRORS.inc(stage=stage)
+    if _stage_buffer is not None:
+        _stage_buffer.append((stage, seconds, error))
+
+
+def buffer_stages():
+    """Also keep stage runs in this process so they can be sent to a parent
+
+    Call once in a worker process; ``drain_stages`` then returns what was
+    recorded since the last call, for the parent to pass to ``record_stage``.
+    """
+    global _stage_buffer
+    _stage_buffer = []
+
+
+def drain_stages():
+    """Return and clear the stage runs buffered since the last call
+
+    Returns:
+        list: (stage, seconds, error) tuples
+    """
+    global _stage_buffer
+    if _stage_buffer is None:
+        return []
+    stages, _stage_buffer = _stage_buffer, []
+    return stages
+
+
+class timed:
+    """Time a stage, usable as a decorator or a context manager
+
+    Example:
+        @timed("predict")
+        def predict(...): ...
+
+        with timed("split_data"):
+            ...
+    """
+
+    def __init__(self, stage):
+        self.stage = stage
+        self._local = threading.local()
+
+    def __enter__(self):
+        starts = getattr(self._local, "starts", None)
+        if starts is None:
+            starts = self._local.starts = []
+        starts.append(time.perf_counter())
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._local.starts.pop()
+        record_stage(self.stage, elapsed, error=exc_type is not None)
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def stage_report():
+    """Summarise the recorded stage timings
+
+    Returns:
+        dict: Mapping of stage name to count, total, mean, max and error count
+    """
+    report = {}
+    for labels, stats in STAGE_DURATION.summary().items():
+        stage = dict(labels)["stage"]
+        report[stage] = dict(stats, errors=STAGE_ERRORS.value(stage=stage))
+    return report
+
+
+def write_profile_report(filepath):
+    """Write the per-stage timing report to a JSON file
+
+    Args:
+        filepath (Path): Destination file
+
+    Returns:
+        dict: The report that was written
+    """
+    report = stage_report()
+    with open(filepath, "w") as f:
+        json.dump(report, f, indent=4)
+    return report
+
+
+def run_profiled(func, output_dir, *args, **kwargs):
+    """Run ``func`` under cProfile and save the results
+
+    Writes ``profile.prof`` (loadable with ``pstats`` or snakeviz) and a
+    ``profile.txt`` summary sorted by cumulative time into ``output_dir``.
+
+    Returns:
+        tuple: (result of ``func``, list of written paths)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+    finally:
+        stats_path = output_dir / "profile.prof"
+        text_path = output_dir / "profile.txt"
+        profiler.dump_stats(stats_path)
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(50)
+        text_path.write_text(buffer.getvalue())
+    return result, [stats_path, text_path]
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes are too frequent to be worth logging
+        pass
+
+
+def start_metrics_server(port, host="0.0.0.0"):
+    """Serve ``/metrics`` from a daemon thread
+
+    Args:
+        port (int): Port to listen on (0 picks a free port)
+        host (str): Interface to bind
+
+    Returns:
+        ThreadingHTTPServer: The running server
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
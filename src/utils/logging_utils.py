@@ -0,0 +1,263 @@
+"""
+Logging helpers for the diabetes prediction MLOps project.
+
+Records are handed off to a background ``QueueListener`` so that callers on the
+serving path never block on disk I/O.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue as queue_module
+import random
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .instrumentation import REGISTRY
+
+
+# Attributes present on every LogRecord; anything else was passed via ``extra``
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+}
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+DROPPED_RECORDS = REGISTRY.counter(
+    "diabetes_log_records_dropped_total", "Log records dropped because the queue was full"
+)
+
+_listener = None
+_queue_handler = None
+_listener_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects"""
+
+    def format(self, record):
+        """Serialize the record, including any fields passed via ``extra``
+
+        Args:
+            record (logging.LogRecord): Record to format
+
+        Returns:
+            str: JSON encoded record
+        """
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of the records emitted by selected loggers
+
+    Records at WARNING or above are always kept, so errors are never sampled away.
+    """
+
+    def __init__(self, rates, seed=None):
+        """
+        Args:
+            rates (dict): Mapping of logger name to the fraction of records to keep
+            seed (int, optional): Seed for the sampling RNG
+        """
+        super().__init__()
+        self.rates = {name: float(rate) for name, rate in (rates or {}).items()}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _rate_for(self, name):
+        """Return the sampling rate of the closest configured ancestor logger"""
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate_for(record.name)
+        if rate >= 1.0:
+            return True
+        with self._lock:
+            return self._random.random() < rate
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers message formatting to the listener thread
+
+    The stock handler renders ``msg % args`` before enqueueing. This one only
+    renders the traceback (which must not outlive the caller's frame) and leaves
+    message formatting to the listener. When the queue is full, records are
+    dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue_module.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+            DROPPED_RECORDS.inc()
+
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _WorkerQueueHandler(LazyQueueHandler):
+    """Queue handler for worker processes; renders the message so no args are pickled"""
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _ForwardHandler(logging.Handler):
+    """Re-dispatch records received from worker processes to this process's loggers"""
+
+    def emit(self, record):
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def forward_worker_logs(log_queue):
+    """Route records that worker processes put on ``log_queue`` into this process
+
+    Records go through the same loggers, sampling and handlers as records
+    logged here. Pair with ``configure_worker_logging`` in the workers.
+
+    Args:
+        log_queue (multiprocessing.Queue): Queue shared with the workers
+
+    Returns:
+        logging.handlers.QueueListener: The running listener; stop it after the workers exit
+    """
+    listener = logging.handlers.QueueListener(log_queue, _ForwardHandler())
+    listener.start()
+    return listener
+
+
+def configure_worker_logging(log_queue, level=logging.INFO):
+    """Send this worker process's records to the parent through ``log_queue``
+
+    A forked worker inherits the parent's queue handler, but not the listener
+    thread that drains it, so that handler is replaced.
+
+    Args:
+        log_queue (multiprocessing.Queue): Queue drained by ``forward_worker_logs``
+        level (int): Root logger level
+    """
+    global _listener, _queue_handler
+    _listener = None
+    _queue_handler = None
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_WorkerQueueHandler(log_queue))
+    root.setLevel(level)
+
+
+def configure_logging(level="INFO", log_file=None, fmt="json", max_bytes=10_485_760,
+                      backup_count=5, sampling=None, queue_size=10_000, console=True):
+    """Route the root logger through a queue drained by a background listener
+
+    Calling this again replaces the previous configuration.
+
+    Args:
+        level (str): Root logger level
+        log_file (Path, optional): Rotating log file; console only if None
+        fmt (str): ``"json"`` for structured records or ``"text"``
+        max_bytes (int): Size at which the log file is rotated
+        backup_count (int): Number of rotated files to keep
+        sampling (dict, optional): Logger name to fraction of records kept
+        queue_size (int): Maximum number of pending records
+        console (bool): Whether to also write records to stderr
+
+    Returns:
+        logging.handlers.QueueListener: The running listener
+    """
+    global _listener, _queue_handler
+
+    formatter = JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT)
+    handlers = [logging.StreamHandler()] if console else []
+    if log_file is not None:
+        log_file = Path(log_file)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        ))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue_module.Queue(maxsize=queue_size)
+    queue_handler = LazyQueueHandler(log_queue)
+    # Sample before enqueueing so dropped records cost nothing downstream
+    queue_handler.addFilter(SamplingFilter(sampling))
+
+    with _listener_lock:
+        stop_logging()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        _queue_handler = queue_handler
+        root.setLevel(getattr(logging, str(level).upper()))
+
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        return _listener
+
+
+def stop_logging():
+    """Flush pending records and stop the background listener, if any
+
+    If any records were dropped because the queue was full, a final warning
+    saying how many is written straight to the handlers.
+    """
+    global _listener, _queue_handler
+    dropped = 0
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        dropped = _queue_handler.dropped
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        if dropped:
+            _listener.handle(logging.LogRecord(
+                __name__, logging.WARNING, __file__, 0,
+                "Dropped %d log records because the logging queue was full", (dropped,), None
+            ))
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
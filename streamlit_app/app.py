@@ -2,11 +2,18 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import joblib
 import yaml
+import sys
 from pathlib import Path
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.exceptions import InferenceOverloadError, ModelPredictionError
+from src.model.inference import InferenceExecutor
+from src.utils.common import setup_logging
+from src.utils.instrumentation import start_metrics_server
+
 # Configure page
 st.set_page_config(
     page_title="Diabetes Prediction MLOps App",
@@ -22,13 +29,29 @@ def load_config():
 
 config = load_config()
 
-# Load model
+# Route logs through the queued JSON pipeline once per server process
+@st.cache_resource
+def start_logging():
+    return setup_logging()
+
+start_logging()
+
+# Expose Prometheus metrics once per server process
+@st.cache_resource
+def start_metrics_exporter():
+    port = config.get("monitoring", {}).get("metrics_port")
+    if port:
+        return start_metrics_server(int(port))
+    return None
+
+start_metrics_exporter()
+
+# Load model into the shared inference pool
 @st.cache_resource
 def load_model():
     try:
-        model = joblib.load("models/diabetes_model.pkl")
-        return model
-    except FileNotFoundError:
+        return InferenceExecutor.from_config()
+    except ModelPredictionError:
         st.error("Model not found! Please train the model first by running the training pipeline.")
         return None
 
@@ -80,7 +103,11 @@ def main():
                 input_data = np.array([[pregnancies, glucose, blood_pressure, bmi, age]])
 
                 # Make prediction
-                prediction, probability = model.predict(input_data)[0], model.predict_proba(input_data)[0][1]
+                try:
+                    prediction, probability = model.predict(input_data)
+                except InferenceOverloadError:
+                    st.warning("The service is busy right now. Please try again in a moment.")
+                    st.stop()
 
                 # Display results
                 with col2:
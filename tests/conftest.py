@@ -0,0 +1,29 @@
+import joblib
+import mlflow
+import numpy as np
+import pytest
+
+@pytest.fixture
+def classification_data():
+    """Five features with a noisy binary label driven by the second one"""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(2000, 5))
+    y = (X[:, 1] + 0.5 * rng.normal(size=2000) > 0).astype(int)
+    return X, y
+
+@pytest.fixture
+def save_fitted_model(tmp_path, classification_data):
+    """Return a function that fits an estimator on the shared data and saves it with joblib"""
+    def _save(estimator, name="model.pkl", n_samples=500):
+        X, y = classification_data
+        path = tmp_path / name
+        joblib.dump(estimator.fit(X[:n_samples], y[:n_samples]), path)
+        return path
+    return _save
+
+@pytest.fixture
+def mlflow_experiment(tmp_path):
+    """Point MLflow at a throwaway sqlite store and return a fresh experiment's id"""
+    mlflow.set_tracking_uri(f"sqlite:///{tmp_path / 'mlflow.db'}")
+    yield mlflow.create_experiment("test-experiment", (tmp_path / "artifacts").as_uri())
+    mlflow.set_tracking_uri(None)
@@ -0,0 +1,100 @@
+import mlflow
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from src.exceptions import ConfigurationError
+from src.model.calibration import (
+    CalibratedModel, calibrate_model, fit_calibration, select_threshold,
+)
+from src.model.model_trainer import predict, save_model
+
+@pytest.mark.parametrize("method", ["isotonic", "platt"])
+def test_fit_calibration_table(method):
+    """Test the lookup table is increasing and within [0, 1]"""
+    rng = np.random.default_rng(1)
+    scores = rng.random(1000)
+    y = (rng.random(1000) < scores ** 2).astype(int)
+
+    table_x, table_y = fit_calibration(scores, y, method)
+
+    assert np.all(np.diff(table_x) >= 0)
+    assert np.all(np.diff(table_y) >= -1e-12)
+    assert table_y.min() >= 0 and table_y.max() <= 1
+
+def test_fit_calibration_unknown_method():
+    """Test unknown methods are rejected"""
+    with pytest.raises(ConfigurationError):
+        fit_calibration(np.array([0.1, 0.9]), np.array([0, 1]), "beta")
+
+def test_select_threshold_meets_target_recall():
+    """Test the chosen threshold is the highest reaching the recall target"""
+    probabilities = np.array([0.1, 0.2, 0.3, 0.4, 0.6, 0.7, 0.8, 0.9])
+    y = np.array([0, 0, 1, 0, 1, 0, 1, 1])
+
+    assert select_threshold(probabilities, y, 0.75) == 0.6
+    assert select_threshold(probabilities, y, 1.0) == 0.3
+
+def test_calibrated_model_serving(classification_data):
+    """Test the bundle applies calibration and threshold at prediction time"""
+    X, y = classification_data
+    model = LogisticRegression().fit(X[:1000], y[:1000])
+
+    bundle = calibrate_model(model, X[1000:1500], y[1000:1500], target_recall=0.9)
+    probabilities = bundle.predict_proba(X[1500:])[:, 1]
+    predictions = bundle.predict(X[1500:])
+
+    assert isinstance(bundle, CalibratedModel)
+    assert np.array_equal(predictions, (probabilities >= bundle.threshold).astype(int))
+    assert predictions[y[1500:] == 1].mean() > 0.8
+
+    prediction, probability = predict(bundle, X[1500:1501])
+    assert prediction == predictions[0]
+    assert probability == pytest.approx(probabilities[0])
+
+def test_platt_is_unregularized():
+    """Test Platt scaling recovers a steep sigmoid instead of shrinking it"""
+    rng = np.random.default_rng(2)
+    scores = rng.random(400)
+    y = (rng.random(400) < 1 / (1 + np.exp(-20 * (scores - 0.5)))).astype(int)
+
+    _, table_y = fit_calibration(scores, y, "platt", n_points=11)
+
+    assert table_y[0] < 0.01 and table_y[-1] > 0.99
+
+def test_calibrated_model_to_dict(classification_data):
+    """Test the calibration summary is JSON-serializable and complete"""
+    import json
+    X, y = classification_data
+    bundle = calibrate_model(LogisticRegression().fit(X[:1000], y[:1000]), X[1000:], y[1000:])
+
+    summary = json.loads(json.dumps(bundle.to_dict()))
+
+    assert summary["threshold"] == bundle.threshold
+    assert summary["calibration_x"] == bundle.calibration_x.tolist()
+
+def test_saved_bundle_is_the_mlflow_model(classification_data, mlflow_experiment, tmp_path):
+    """Test runs:/<id>/model is the calibrated bundle that serving loads"""
+    X, y = classification_data
+    bundle = calibrate_model(LogisticRegression().fit(X[:1000], y[:1000]), X[1000:], y[1000:])
+
+    with mlflow.start_run(experiment_id=mlflow_experiment) as run:
+        save_model(bundle, tmp_path / "model.pkl")
+    logged = mlflow.pyfunc.load_model(f"runs:/{run.info.run_id}/model")
+
+    np.testing.assert_array_equal(logged.predict(X[:200]), bundle.predict(X[:200]))
+
+def test_cross_validated_calibration_keeps_the_fitted_model(classification_data):
+    """Test out-of-fold calibration uses every training row and leaves the model as fitted"""
+    X, y = classification_data
+    X, y = X[:600], y[:600]
+    model = LogisticRegression().fit(X, y)
+    coef = model.coef_.copy()
+
+    bundle = calibrate_model(model, X, y, target_recall=0.8, cv=5)
+    calibrated = bundle.predict_proba(X)[:, 1]
+
+    assert bundle.estimator is model
+    np.testing.assert_array_equal(model.coef_, coef)
+    assert bundle.method == "platt"
+    assert bundle.predict(X)[y == 1].mean() >= 0.75
+    assert np.all(np.diff(calibrated[np.argsort(model.predict_proba(X)[:, 1])]) >= -1e-12)
@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+import time
+import pytest
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from threadpoolctl import threadpool_info
+from src.exceptions import InferenceOverloadError
+from src.model.inference import QUEUE_WAIT, InferenceExecutor
+from src.utils.instrumentation import REGISTRY, stage_report
+from src.utils.logging_utils import configure_logging, stop_logging
+
+@pytest.fixture
+def model_path(save_fitted_model):
+    return save_fitted_model(RandomForestClassifier(n_estimators=5, n_jobs=4, random_state=0))
+
+def test_executor_predicts_concurrently(model_path):
+    """Test the pool serves many concurrent predictions single-threaded"""
+    test_input = np.array([[2, 130, 70, 28.5, 45]])
+    with InferenceExecutor(model_path, workers=2, max_queue=64) as executor:
+        assert executor._model.n_jobs == 1
+        futures = [executor.submit(test_input) for _ in range(20)]
+        results = [future.result() for future in futures]
+        stats = executor.stats()
+
+    assert all(prediction in [0, 1] and 0 <= probability <= 1
+               for prediction, probability in results)
+    assert stats["completed"] == 20
+    assert stats["in_flight"] == 0
+    assert stats["rejected"] == 0
+
+def test_executor_rejects_when_full(model_path):
+    """Test backpressure rejects requests beyond workers + max_queue"""
+    release = threading.Event()
+    with InferenceExecutor(model_path, workers=1, max_queue=1) as executor:
+        executor._model.predict = lambda X: release.wait(5) and np.array([0])
+        first = executor.submit(np.zeros((1, 5)))
+        second = executor.submit(np.zeros((1, 5)))
+        while executor.stats()["busy"] < 1:
+            time.sleep(0.01)
+
+        with pytest.raises(InferenceOverloadError):
+            executor.submit(np.zeros((1, 5)))
+        stats = executor.stats()
+
+        release.set()
+        first.result(), second.result()
+
+    assert stats["in_flight"] == 2
+    assert stats["saturation"] == 1.0
+    assert stats["queue_depth"] == 1
+    assert stats["rejected"] == 1
+
+def test_executor_process_mode(model_path):
+    """Test process workers load their own model copy"""
+    with InferenceExecutor(model_path, workers=2, mode="process") as executor:
+        prediction, probability = executor.predict(np.array([[2, 130, 70, 28.5, 45]]))
+
+    assert prediction in [0, 1]
+    assert 0 <= probability <= 1
+
+def test_process_mode_forwards_logs_and_metrics(model_path, tmp_path):
+    """Test worker log records and timings reach the serving process"""
+    log_file = tmp_path / "app.log"
+    REGISTRY.reset()
+    configure_logging(log_file=log_file, console=False)
+    try:
+        with InferenceExecutor(model_path, workers=2, mode="process") as executor:
+            for _ in range(10):
+                executor.predict(np.array([[2, 130, 70, 28.5, 45]]))
+    finally:
+        stop_logging()
+
+    messages = [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+    assert messages.count("Prediction made") == 10
+    assert any(message.startswith("Model loaded") for message in messages)
+    report = stage_report()
+    assert report["predict"]["count"] == 10
+    assert 1 <= report["load_model"]["count"] <= 2
+    assert QUEUE_WAIT.summary()[()]["count"] == 10
+    assert "diabetes_inference_queue_wait_seconds_count 10" in REGISTRY.render_prometheus()
+
+def _num_threads(user_api):
+    return {info["num_threads"] for info in threadpool_info() if info["user_api"] == user_api}
+
+def test_thread_mode_limits_each_worker_and_restores(model_path):
+    """Test worker threads get the OpenMP cap and limits are restored on shutdown"""
+    before = {api: _num_threads(api) for api in ("openmp", "blas")}
+    env_before = os.environ.get("OMP_NUM_THREADS")
+
+    with InferenceExecutor(model_path, workers=2, threads_per_worker=3) as executor:
+        in_worker = executor._pool.submit(_num_threads, "openmp").result()
+
+    assert in_worker == {3} or not before["openmp"]
+    assert {api: _num_threads(api) for api in ("openmp", "blas")} == before
+    assert os.environ.get("OMP_NUM_THREADS") == env_before
@@ -0,0 +1,53 @@
+import urllib.request
+import pytest
+from src.utils.instrumentation import (
+    MetricsRegistry, REGISTRY, timed, stage_report, start_metrics_server,
+)
+
+def test_histogram_prometheus_format():
+    """Test histograms render cumulative buckets, sum and count"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    histogram.observe(0.05, stage="predict")
+    histogram.observe(0.5, stage="predict")
+    histogram.observe(5.0, stage="predict")
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{stage="predict",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{stage="predict",le="1"} 2' in text
+    assert 'latency_seconds_bucket{stage="predict",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{stage="predict"} 3' in text
+
+def test_timed_decorator_and_context_manager():
+    """Test timed records calls and errors for both usages"""
+    REGISTRY.reset()
+
+    @timed("unit_stage")
+    def work():
+        return 42
+
+    assert work() == 42
+    with pytest.raises(ValueError):
+        with timed("unit_stage"):
+            raise ValueError("boom")
+
+    report = stage_report()["unit_stage"]
+    assert report["count"] == 2
+    assert report["errors"] == 1
+    assert report["max_seconds"] >= report["mean_seconds"] >= 0
+
+def test_metrics_server_serves_registry():
+    """Test the /metrics endpoint exposes the stage histograms"""
+    REGISTRY.reset()
+    with timed("served_stage"):
+        pass
+    server = start_metrics_server(0, host="127.0.0.1")
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        body = urllib.request.urlopen(url, timeout=5).read().decode()
+    finally:
+        server.shutdown()
+
+    assert 'diabetes_stage_calls_total{stage="served_stage"} 1' in body
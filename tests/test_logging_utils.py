@@ -0,0 +1,66 @@
+import json
+import logging
+import queue
+from src.utils import logging_utils
+from src.utils.logging_utils import (
+    DROPPED_RECORDS, JsonFormatter, LazyQueueHandler, SamplingFilter, configure_logging,
+    stop_logging,
+)
+
+def _record(name="src.model.predictions", level=logging.INFO, msg="Prediction made", args=()):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+def test_json_formatter_includes_extra_fields():
+    """Test structured records carry fields passed via extra"""
+    record = _record(msg="Model loaded from %s", args=("models/diabetes_model.pkl",))
+    record.probability = 0.42
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "Model loaded from models/diabetes_model.pkl"
+    assert payload["level"] == "INFO"
+    assert payload["probability"] == 0.42
+
+def test_sampling_filter_rates():
+    """Test sampling applies to child loggers but never drops warnings"""
+    sampler = SamplingFilter({"src.model.predictions": 0.0, "src.data": 1.0}, seed=0)
+
+    assert not sampler.filter(_record())
+    assert not sampler.filter(_record(name="src.model.predictions.child"))
+    assert sampler.filter(_record(level=logging.WARNING))
+    assert sampler.filter(_record(name="src.data.data_ingestion"))
+    assert sampler.filter(_record(name="src.pipeline"))
+
+def test_configure_logging_writes_json_file(tmp_path):
+    """Test queued records end up in the log file once the listener stops"""
+    log_file = tmp_path / "logs" / "app.log"
+    configure_logging(log_file=log_file, console=False)
+    try:
+        logging.getLogger("src.test").info("hello %s", "world")
+    finally:
+        stop_logging()
+
+    lines = log_file.read_text().splitlines()
+    assert json.loads(lines[-1])["message"] == "hello world"
+
+def test_full_queue_drops_and_counts_records():
+    """Test records are dropped without blocking when the queue is full"""
+    handler = LazyQueueHandler(queue.Queue(maxsize=1))
+    before = DROPPED_RECORDS.value()
+
+    handler.handle(_record())
+    handler.handle(_record())
+
+    assert handler.dropped == 1
+    assert DROPPED_RECORDS.value() == before + 1
+
+def test_stop_logging_reports_dropped_records(tmp_path):
+    """Test the number of dropped records is logged when the listener stops"""
+    log_file = tmp_path / "app.log"
+    configure_logging(log_file=log_file, console=False)
+    logging_utils._queue_handler.dropped = 3
+    stop_logging()
+
+    last = json.loads(log_file.read_text().splitlines()[-1])
+    assert last["level"] == "WARNING"
+    assert "Dropped 3 log records" in last["message"]
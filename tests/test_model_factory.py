@@ -0,0 +1,86 @@
+import pytest
+import mlflow
+from box import ConfigBox
+from src.model import model_trainer
+from src.exceptions import ConfigurationError, ModelTrainingError
+from src.model.model_factory import build_model, train_candidates, select_champion
+
+def _result(name, accuracy, latency):
+    return {"name": name, "metrics": {"accuracy": accuracy, "latency_p99_ms": latency}}
+
+def test_build_model_unknown_name():
+    """Test unknown model names are rejected"""
+    with pytest.raises(ConfigurationError):
+        build_model("NotAModel")
+
+def test_select_champion_budget():
+    """Test the fastest model within tolerance of the best score wins"""
+    results = [
+        _result("slow_best", 0.80, 40.0),
+        _result("fast_close", 0.795, 2.0),
+        _result("fastest_bad", 0.70, 1.0),
+        _result("over_budget", 0.90, 500.0),
+    ]
+
+    champion = select_champion(results, {"max_latency_ms": 50, "tolerance": 0.01})
+    assert champion["name"] == "fast_close"
+
+    champion = select_champion(results, {"max_latency_ms": 50, "tolerance": 0.0})
+    assert champion["name"] == "slow_best"
+
+    with pytest.raises(ModelTrainingError):
+        select_champion(results, {"max_latency_ms": 0.5})
+
+def test_train_candidates_in_parallel(classification_data):
+    """Test candidates are trained, evaluated and timed"""
+    X, y = classification_data
+    candidates = {
+        "RandomForest": {"n_estimators": 10, "random_state": 0},
+        "LogisticRegression": {"max_iter": 200},
+    }
+
+    results = train_candidates(candidates, X[:200], y[:200], X[200:300], y[200:300],
+                               max_workers=2, latency_repeats=10)
+
+    assert [r["name"] for r in results] == ["RandomForest", "LogisticRegression"]
+    for result in results:
+        assert result["metrics"]["accuracy"] > 0.7
+        assert result["metrics"]["latency_p99_ms"] > 0
+        assert result["model"].predict_proba(X[:1]).shape == (1, 2)
+
+@pytest.fixture
+def hgb_training(monkeypatch, classification_data, mlflow_experiment):
+    """Config with a single HistGradientBoosting candidate and a throwaway MLflow store"""
+    config = ConfigBox({
+        "model": {
+            "candidates": {"HistGradientBoosting": {"max_iter": 20, "random_state": 0}},
+            "max_workers": 1,
+            "selection": {"latency_repeats": 5},
+        },
+        "mlflow": {"experiment_name": "test-experiment"},
+    })
+    monkeypatch.setattr(model_trainer, "load_config", lambda: config)
+    X, y = classification_data
+    return mlflow_experiment, (X[:150], y[:150], X[150:200], y[150:200])
+
+def test_train_model_logs_hgb_champion(hgb_training):
+    """Test training end to end when HistGradientBoosting is the champion"""
+    experiment_id, split = hgb_training
+
+    model = model_trainer.train_model(*split)
+    runs = mlflow.search_runs([experiment_id], filter_string="params.champion != ''")
+
+    assert type(model).__name__ == "HistGradientBoostingClassifier"
+    assert runs["params.champion"].tolist() == ["HistGradientBoosting"]
+    # Selection metrics come from the validation slice; the test set is reported later
+    assert "metrics.val_accuracy" in runs and "metrics.accuracy" not in runs
+
+def test_train_model_joins_active_run(hgb_training):
+    """Test the champion is logged to the caller's run, e.g. the training pipeline's"""
+    experiment_id, split = hgb_training
+
+    with mlflow.start_run(experiment_id=experiment_id) as run:
+        model_trainer.train_model(*split)
+        assert mlflow.active_run().info.run_id == run.info.run_id
+
+    assert mlflow.get_run(run.info.run_id).data.params["champion"] == "HistGradientBoosting"
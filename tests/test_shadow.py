@@ -0,0 +1,99 @@
+import time
+import pytest
+import joblib
+from sklearn.linear_model import LogisticRegression
+from src.exceptions import ModelPredictionError
+from src.model import inference
+from src.model.inference import InferenceExecutor
+from src.model.shadow import ShadowScorer
+
+@pytest.fixture
+def model_paths(save_fitted_model, classification_data):
+    paths = [save_fitted_model(LogisticRegression(C=C), name)
+             for name, C in [("primary.pkl", 1.0), ("shadow.pkl", 0.01)]]
+    return paths, classification_data[0]
+
+def test_shadow_scorer_compares_batches(model_paths):
+    """Test mirrored requests are scored in the background and compared"""
+    (primary_path, shadow_path), X = model_paths
+    primary = joblib.load(primary_path)
+    shadow = ShadowScorer(shadow_path, batch_size=16, flush_interval=0.05)
+
+    for row in X[:100]:
+        row = row.reshape(1, -1)
+        shadow.submit(row, int(primary.predict(row)[0]), float(primary.predict_proba(row)[0, 1]))
+    shadow.close()
+    stats = shadow.stats()
+
+    assert stats["scored"] == 100
+    assert stats["dropped"] == 0
+    assert 0.5 < stats["agreement_rate"] <= 1.0
+    assert 0 < stats["mean_abs_delta"] <= stats["max_abs_delta"] <= 1
+
+def test_shadow_scorer_drops_when_full(model_paths):
+    """Test a full queue drops mirrored requests instead of blocking"""
+    (_, shadow_path), X = model_paths
+    shadow = ShadowScorer(shadow_path, max_queue=1)
+    shadow.model = type("Slow", (), {"predict_proba": lambda self, X: time.sleep(0.5)})()
+
+    start = time.perf_counter()
+    for _ in range(50):
+        shadow.submit(X[:1], 0, 0.5)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.1
+    assert shadow.stats()["dropped"] >= 48
+
+def test_executor_mirrors_to_shadow(model_paths):
+    """Test the inference pool mirrors answered requests to the shadow model"""
+    (primary_path, shadow_path), X = model_paths
+    shadow = ShadowScorer(shadow_path, flush_interval=0.05)
+
+    with InferenceExecutor(primary_path, workers=2, max_queue=64, shadow=shadow) as executor:
+        results = [executor.predict(X[i:i + 1]) for i in range(20)]
+
+    assert len(results) == 20
+    assert shadow.stats()["scored"] == 20
+
+def test_shadow_scorer_close_never_raises(model_paths):
+    """Test close returns within its timeout while a full queue is still draining"""
+    (_, shadow_path), X = model_paths
+    shadow = ShadowScorer(shadow_path, max_queue=1)
+    shadow.model = type("Slow", (), {"predict_proba": lambda self, X: time.sleep(0.5)})()
+    shadow.submit(X[:1], 0, 0.5)
+    time.sleep(0.1)  # the scoring thread is now busy with the first request
+    for _ in range(5):
+        shadow.submit(X[:1], 0, 0.5)
+
+    start = time.perf_counter()
+    shadow.close(timeout=0.05)
+
+    assert time.perf_counter() - start < 0.5
+    shadow.submit(X[:1], 0, 0.5)
+    assert shadow.stats()["dropped"] >= 3
+
+def test_from_config_survives_a_bad_shadow_model(model_paths, monkeypatch, tmp_path, caplog):
+    """Test a shadow model that fails to load leaves primary serving running"""
+    (primary_path, _), X = model_paths
+    serving = {"workers": 1, "shadow_model": str(tmp_path / "missing.pkl")}
+    monkeypatch.setattr(inference, "load_config", lambda: {"serving": serving})
+
+    with InferenceExecutor.from_config(primary_path) as executor:
+        prediction, _ = executor.predict(X[:1])
+
+    assert executor.shadow is None
+    assert prediction in [0, 1]
+    assert "Shadow model" in caplog.text
+
+def test_from_config_loads_primary_before_shadow(model_paths, monkeypatch, tmp_path):
+    """Test no shadow scorer is started when the primary model fails to load"""
+    (_, shadow_path), _ = model_paths
+    serving = {"shadow_model": str(shadow_path)}
+    monkeypatch.setattr(inference, "load_config", lambda: {"serving": serving})
+    started = []
+    monkeypatch.setattr(inference, "ShadowScorer", lambda *args, **kwargs: started.append(args))
+
+    with pytest.raises(ModelPredictionError):
+        InferenceExecutor.from_config(tmp_path / "missing.pkl")
+
+    assert started == []
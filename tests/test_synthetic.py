@@ -0,0 +1,49 @@
+import pandas as pd
+from src.constants import REQUIRED_COLUMNS
+from src.data.data_ingestion import ingest_data, validate_data
+from src.data.synthetic import generate_dataset, generate_chunks, write_dataset
+
+def test_generate_dataset_is_deterministic():
+    """Test the same seed always yields the same rows"""
+    first = generate_dataset(5000, seed=7)
+    second = generate_dataset(5000, seed=7)
+    other = generate_dataset(5000, seed=8)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert not first.equals(other)
+    assert list(first.columns) == REQUIRED_COLUMNS
+    assert len(first) == 5000
+
+def test_generate_dataset_distribution():
+    """Test outcome rate, class separation and zero-valued measurements"""
+    df = generate_dataset(200_000, seed=0)
+
+    assert 0.33 < df["Outcome"].mean() < 0.37
+    means = df[df["Glucose"] > 0].groupby("Outcome")["Glucose"].mean()
+    assert means[1] > means[0] + 20
+    assert 0.03 < (df["BloodPressure"] == 0).mean() < 0.06
+    assert df["Age"].min() >= 21
+
+def test_generate_chunks_sizes():
+    """Test chunking covers exactly the requested rows"""
+    sizes = [len(chunk) for chunk in generate_chunks(2500, chunk_size=1000)]
+    assert sizes == [1000, 1000, 500]
+
+def test_ingest_synthetic_csv(tmp_path):
+    """Test ingest_data can read generated data instead of the downloaded CSV"""
+    output = write_dataset(3000, tmp_path / "synthetic.csv", chunk_size=1000, nan_rate=0.01)
+
+    df = ingest_data(output)
+
+    assert len(df) == 3000
+    assert validate_data(df)
+    assert df.isnull().sum().sum() == 0
+
+def test_csv_round_trips_chunks(tmp_path):
+    """Test chunked CSV output reads back as the generated rows, missing values included"""
+    output = write_dataset(2500, tmp_path / "synthetic.csv", seed=3, chunk_size=1000,
+                           nan_rate=0.01)
+
+    expected = pd.concat(generate_chunks(2500, seed=3, chunk_size=1000, nan_rate=0.01),
+                         ignore_index=True)
+    pd.testing.assert_frame_equal(pd.read_csv(output), expected, check_dtype=False)